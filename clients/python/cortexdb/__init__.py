@@ -41,6 +41,7 @@ from .exceptions import (
     CortexDBConnectionError,
     CortexDBError,
     CortexDBNotFoundError,
+    CortexDBPartialWriteError,
     CortexDBPermissionError,
     CortexDBServerError,
     CortexDBTimeoutError,
@@ -71,6 +72,7 @@ __all__ = [
     "CortexDBAuthenticationError",
     "CortexDBPermissionError",
     "CortexDBServerError",
+    "CortexDBPartialWriteError",
     # Models
     "CollectionSchema",
     "FieldDefinition",
@@ -2,10 +2,13 @@
 
 from typing import Optional, Union
 
+import httpx
+
 from .collections import CollectionsAPI
 from .connection_string import parse_connection_string
 from .http_client import HTTPClient
 from .records import RecordsAPI
+from .search import SearchAPI
 
 
 class CortexClient:
@@ -35,6 +38,11 @@ class CortexClient:
         base_url: Union[str, None] = None,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        pool_size: Optional[int] = None,
+        semantic_cache_threshold: Optional[float] = None,
+        http2: bool = False,
+        msgpack: bool = False,
     ):
         """Initialize CortexDB client.
 
@@ -47,11 +55,34 @@ class CortexClient:
                           - "cortexdb://my-key@localhost:8000" (connection string with API key)
             api_key: Optional API key for authentication (ignored if using connection string with key)
             timeout: Request timeout in seconds (default: 30.0)
+            limits: Optional httpx connection pool limits, e.g. to allow more
+                    concurrent requests from a busy backend
+            pool_size: Shorthand for ``limits``: keep up to this many connections
+                       open and alive. Cannot be combined with ``limits``.
+            semantic_cache_threshold: Similarity (0-1) above which the gateway's
+                       semantic cache may answer a search with the response of a
+                       similar earlier query. Uses the gateway default if not set.
+            http2: Use HTTP/2 when the gateway offers it over HTTPS, so concurrent
+                   requests share one multiplexed connection. Requires the
+                   ``http2`` extra (``pip install cortexdb[http2]``).
+            msgpack: Receive search and vector responses as msgpack instead of
+                     JSON (smaller, faster to decode). Requires the ``msgpack``
+                     extra (``pip install cortexdb[msgpack]``).
+
+        Raises:
+            ValueError: If both limits and pool_size are given, or pool_size < 1
+            ImportError: If msgpack is requested but not installed
 
         Example:
             >>> client = CortexClient("http://localhost:8000")
             >>> client = CortexClient("https://api.cortexdb.com", api_key="your-key")
             >>> client = CortexClient("cortexdb://my-key@localhost:8000")
+            >>> client = CortexClient(
+            ...     "http://localhost:8000",
+            ...     limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            ... )
+            >>> client = CortexClient("http://localhost:8000", pool_size=100)
+            >>> client = CortexClient("https://api.cortexdb.com", http2=True)
         """
         # Handle connection string
         if base_url and base_url.startswith("cortexdb://"):
@@ -61,15 +92,34 @@ class CortexClient:
             if parsed.api_key:
                 api_key = parsed.api_key
         
+        if pool_size is not None:
+            if limits is not None:
+                raise ValueError("Pass either limits or pool_size, not both")
+            if pool_size < 1:
+                raise ValueError("pool_size must be a positive integer")
+            limits = httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            )
+
         # Default base_url if not provided
         if not base_url:
             base_url = "http://localhost:8000"
         
-        self._http = HTTPClient(base_url=base_url, api_key=api_key, timeout=timeout)
-
-        # API modules
-        self.collections = CollectionsAPI(self._http)
-        self.records = RecordsAPI(self._http)
+        self._http = HTTPClient(
+            base_url=base_url,
+            api_key=api_key,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            msgpack=msgpack,
+        )
+
+        # API modules; writes invalidate the search cache of the affected collection
+        self.search = SearchAPI(
+            self._http, semantic_cache_threshold=semantic_cache_threshold
+        )
+        self.collections = CollectionsAPI(self._http, on_write=self.search.invalidate)
+        self.records = RecordsAPI(self._http, on_write=self.search.invalidate)
 
     async def close(self) -> None:
         """Close the client and cleanup resources.
@@ -1,7 +1,8 @@
 """Collections API for CortexDB."""
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+from .exceptions import CortexDBNotFoundError
 from .http_client import HTTPClient
 from .models import CollectionSchema, FieldDefinition
 
@@ -9,13 +10,23 @@ from .models import CollectionSchema, FieldDefinition
 class CollectionsAPI:
     """API for managing collections."""
 
-    def __init__(self, http_client: HTTPClient):
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        on_write: Optional[Callable[[str], None]] = None,
+    ):
         """Initialize Collections API.
 
         Args:
             http_client: HTTP client instance
+            on_write: Optional callback invoked with the collection name after a write
         """
         self._http = http_client
+        self._on_write = on_write
+
+    def _notify_write(self, collection: str) -> None:
+        if self._on_write is not None:
+            self._on_write(collection)
 
     async def list(self, database: Optional[str] = None) -> List[CollectionSchema]:
         """List all collections.
@@ -90,22 +101,7 @@ class CollectionsAPI:
             ...         embedding_provider="gemini-pro"
             ...     )
         """
-        # Check if any field has vectorize=True
-        has_vectorize = any(field.vectorize for field in fields)
-        
-        if has_vectorize and not embedding_provider:
-            raise ValueError(
-                "embedding_provider is required when using vectorize=True. "
-                "Please provide an embedding_provider parameter or set vectorize=False on your fields."
-            )
-        
-        payload = {
-            "name": name,
-            "fields": [field.model_dump(exclude_none=True) for field in fields],
-        }
-
-        if embedding_provider:
-            payload["config"] = {"embedding_provider_id": embedding_provider}
+        payload = self._build_payload(name, fields, embedding_provider)
 
         if database:
             response = await self._http.post(
@@ -118,6 +114,39 @@ class CollectionsAPI:
         collection_name = response.get("collection", name)
         return await self.get(collection_name, database)
 
+    async def create_or_replace(
+        self,
+        name: str,
+        fields: List[FieldDefinition],
+        embedding_provider: Optional[str] = None,
+    ) -> CollectionSchema:
+        """Create a collection, dropping any existing collection with the same name.
+
+        Replaces the ``delete`` + ``create`` pair with a single request, without a 404
+        when the collection does not exist yet.
+
+        Args:
+            name: Collection name
+            fields: List of field definitions
+            embedding_provider: Optional embedding provider name
+
+        Returns:
+            Created collection schema
+
+        Raises:
+            ValueError: If vectorize=True is used without embedding_provider
+
+        Example:
+            >>> schema = await client.collections.create_or_replace(
+            ...     name="documents",
+            ...     fields=[FieldDefinition(name="title", type=FieldType.STRING)],
+            ... )
+        """
+        payload = self._build_payload(name, fields, embedding_provider)
+        await self._http.put(f"/collections/{name}", json=payload)
+        self._notify_write(name)
+        return await self.get(name)
+
     async def get(self, name: str, database: Optional[str] = None) -> CollectionSchema:
         """Get collection schema.
 
@@ -135,17 +164,69 @@ class CollectionsAPI:
         response = await self._http.get(path)
         return CollectionSchema(**response)
 
-    async def delete(self, name: str, database: Optional[str] = None) -> None:
+    async def exists(self, name: str) -> bool:
+        """Check whether a collection exists with a single HEAD request.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            True if the collection exists, False otherwise
+        """
+        try:
+            await self._http.head(f"/collections/{name}")
+        except CortexDBNotFoundError:
+            return False
+        return True
+
+    async def delete(
+        self,
+        name: str,
+        database: Optional[str] = None,
+        ignore_missing: bool = False,
+    ) -> None:
         """Delete a collection.
 
         Args:
             name: Collection name
             database: Optional database name
+            ignore_missing: If True, a missing collection is not an error
 
         Raises:
-            CortexDBNotFoundError: If collection doesn't exist
+            CortexDBNotFoundError: If collection doesn't exist and ignore_missing is False
+
+        Example:
+            >>> # Reset a collection without a try/except around the delete
+            >>> await client.collections.delete("documents", ignore_missing=True)
         """
+        params = {"ignore_missing": "true"} if ignore_missing else None
         if database:
-            await self._http.delete(f"/databases/{database}/collections/{name}")
+            await self._http.delete(f"/databases/{database}/collections/{name}", params=params)
         else:
-            await self._http.delete(f"/collections/{name}")
+            await self._http.delete(f"/collections/{name}", params=params)
+        self._notify_write(name)
+
+    @staticmethod
+    def _build_payload(
+        name: str,
+        fields: List[FieldDefinition],
+        embedding_provider: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build the collection creation payload, validating vectorized fields."""
+        # Check if any field has vectorize=True
+        has_vectorize = any(field.vectorize for field in fields)
+
+        if has_vectorize and not embedding_provider:
+            raise ValueError(
+                "embedding_provider is required when using vectorize=True. "
+                "Please provide an embedding_provider parameter or set vectorize=False on your fields."
+            )
+
+        payload: Dict[str, Any] = {
+            "name": name,
+            "fields": [field.model_dump(exclude_none=True) for field in fields],
+        }
+
+        if embedding_provider:
+            payload["config"] = {"embedding_provider_id": embedding_provider}
+        return payload
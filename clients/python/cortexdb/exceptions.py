@@ -1,6 +1,6 @@
 """CortexDB exceptions."""
 
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class CortexDBError(Exception):
@@ -39,3 +39,17 @@ class CortexDBPermissionError(CortexDBError):
 
 class CortexDBServerError(CortexDBError):
     """Raised when server returns 5xx error."""
+
+
+class CortexDBPartialWriteError(CortexDBError):
+    """Raised when some batches of a multi-request write failed.
+
+    Attributes:
+        created_ids: One entry per input record: its ID if it was created, else None
+        errors: The errors of the failed batches
+    """
+
+    def __init__(self, message: str, created_ids: List[Optional[str]], errors: List[CortexDBError]):
+        super().__init__(message, errors[0].status_code if errors else None)
+        self.created_ids = created_ids
+        self.errors = errors
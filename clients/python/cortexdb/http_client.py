@@ -1,6 +1,7 @@
 """HTTP client wrapper for CortexDB API."""
 
-from typing import Any, Dict, Optional
+import json as jsonlib
+from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
 
@@ -15,6 +16,8 @@ from .exceptions import (
     CortexDBValidationError,
 )
 
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
 
 class HTTPClient:
     """HTTP client for CortexDB API with error handling."""
@@ -24,6 +27,9 @@ class HTTPClient:
         base_url: str,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        msgpack: bool = False,
     ):
         """Initialize HTTP client.
 
@@ -31,15 +37,39 @@ class HTTPClient:
             base_url: Base URL of CortexDB gateway
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds
+            limits: Optional connection pool limits (httpx defaults if not set)
+            http2: Negotiate HTTP/2 on HTTPS connections (requires the ``h2`` package)
+            msgpack: Ask for msgpack instead of JSON where the gateway supports it
+                (requires the ``msgpack`` package)
+
+        Raises:
+            ImportError: If msgpack is requested but not installed
         """
         headers = {}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
+        self._msgpack: Any = None
+        if msgpack:
+            try:
+                import msgpack as msgpack_module
+            except ImportError as e:
+                raise ImportError(
+                    "msgpack=True requires the msgpack package: pip install cortexdb[msgpack]"
+                ) from e
+            self._msgpack = msgpack_module
+            headers["Accept"] = f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.9"
+
+        client_kwargs: Dict[str, Any] = {}
+        if limits is not None:
+            client_kwargs["limits"] = limits
+
         self._client = httpx.AsyncClient(
             base_url=base_url,
             headers=headers,
             timeout=timeout,
+            http2=http2,
+            **client_kwargs,
         )
 
     async def close(self) -> None:
@@ -66,7 +96,7 @@ class HTTPClient:
             params: Query parameters
 
         Returns:
-            Response JSON data
+            Response data (decoded from JSON or msgpack)
 
         Raises:
             CortexDBError: On any error
@@ -85,10 +115,50 @@ class HTTPClient:
             if response.status_code >= 400:
                 self._raise_for_status(response)
 
-            # Parse JSON response
-            if response.content:
-                return response.json()
-            return None
+            # Parse JSON (or negotiated msgpack) response
+            if not response.content:
+                return None
+            if self._msgpack is not None and response.headers.get(
+                "content-type", ""
+            ).startswith(MSGPACK_MEDIA_TYPE):
+                return self._msgpack.unpackb(response.content, raw=False)
+            return response.json()
+
+        except httpx.TimeoutException as e:
+            raise CortexDBTimeoutError(f"Request timed out: {e}") from e
+        except httpx.ConnectError as e:
+            raise CortexDBConnectionError(f"Connection failed: {e}") from e
+        except httpx.HTTPError as e:
+            raise CortexDBError(f"HTTP error occurred: {e}") from e
+
+    async def stream_lines(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Make a streaming request and yield each NDJSON line as it arrives.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            json: JSON body
+
+        Yields:
+            Parsed JSON value of each non-empty line
+
+        Raises:
+            CortexDBError: On any error
+        """
+        try:
+            async with self._client.stream(method, path, json=json) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response)
+
+                async for line in response.aiter_lines():
+                    if line:
+                        yield jsonlib.loads(line)
 
         except httpx.TimeoutException as e:
             raise CortexDBTimeoutError(f"Request timed out: {e}") from e
@@ -144,6 +214,14 @@ class HTTPClient:
         """POST request."""
         return await self.request("POST", path, json=json, data=data, files=files)
 
+    async def put(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """PUT request."""
+        return await self.request("PUT", path, json=json)
+
     async def patch(
         self,
         path: str,
@@ -154,6 +232,10 @@ class HTTPClient:
         """PATCH request."""
         return await self.request("PATCH", path, json=json, data=data, files=files)
 
-    async def delete(self, path: str) -> Any:
+    async def head(self, path: str) -> Any:
+        """HEAD request."""
+        return await self.request("HEAD", path)
+
+    async def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """DELETE request."""
-        return await self.request("DELETE", path)
+        return await self.request("DELETE", path, params=params)
@@ -1,8 +1,10 @@
 """Records API for CortexDB."""
 
+import asyncio
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
 
+from .exceptions import CortexDBError, CortexDBPartialWriteError
 from .http_client import HTTPClient
 from .models import QueryRequest, Record, SearchResult, VectorChunk
 
@@ -10,13 +12,23 @@ from .models import QueryRequest, Record, SearchResult, VectorChunk
 class RecordsAPI:
     """API for managing records."""
 
-    def __init__(self, http_client: HTTPClient):
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        on_write: Optional[Callable[[str], None]] = None,
+    ):
         """Initialize Records API.
 
         Args:
             http_client: HTTP client instance
+            on_write: Optional callback invoked with the collection name after a write
         """
         self._http = http_client
+        self._on_write = on_write
+
+    def _notify_write(self, collection: str) -> None:
+        if self._on_write is not None:
+            self._on_write(collection)
 
     async def create(
         self,
@@ -49,31 +61,18 @@ class RecordsAPI:
             ... )
         """
         if files:
-            # Multipart form data
+            # Multipart form data; file paths are streamed from disk, not read into memory
             form_data = data.copy()
-            file_objects = {}
-
-            for field_name, file_value in files.items():
-                if isinstance(file_value, (str, Path)):
-                    # File path
-                    file_path = Path(file_value)
-                    file_objects[field_name] = open(file_path, "rb")
-                elif isinstance(file_value, bytes):
-                    # Bytes
-                    file_objects[field_name] = file_value
-                else:
-                    file_objects[field_name] = file_value
-
-            response = await self._http.post(
-                f"/collections/{collection}/records",
-                data=form_data,
-                files=file_objects,
-            )
-
-            # Close file handles
-            for file_obj in file_objects.values():
-                if hasattr(file_obj, "close"):
-                    file_obj.close()
+            file_objects = self._open_files(files)
+
+            try:
+                response = await self._http.post(
+                    f"/collections/{collection}/records",
+                    data=form_data,
+                    files=file_objects,
+                )
+            finally:
+                self._close_files(file_objects)
         else:
             # JSON request
             response = await self._http.post(
@@ -81,10 +80,105 @@ class RecordsAPI:
                 json=data,
             )
 
+        self._notify_write(collection)
+
         # Create returns only ID - fetch the full record
         record_id = response.get("id")
         return await self.get(collection, record_id)
 
+    async def bulk_create(self, collection: str, data: List[Dict[str, Any]]) -> List[str]:
+        """Create several records in a single request.
+
+        Args:
+            collection: Collection name
+            data: List of record data dicts (JSON fields only, no files)
+
+        Returns:
+            IDs of the created records, in the same order as ``data``
+
+        Example:
+            >>> ids = await client.records.bulk_create(
+            ...     collection="documents",
+            ...     data=[
+            ...         {"title": "Hello", "content": "World"},
+            ...         {"title": "Foo", "content": "Bar"},
+            ...     ]
+            ... )
+        """
+        response = await self._http.post(
+            f"/collections/{collection}/records/batch",
+            json={"records": data},
+        )
+        self._notify_write(collection)
+
+        return [item["id"] for item in response.get("records", [])]
+
+    async def create_many(
+        self,
+        collection: str,
+        data: List[Dict[str, Any]],
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+    ) -> List[str]:
+        """Create any number of records, split into ``bulk_create`` batches.
+
+        Up to ``max_concurrency`` batches are in flight at once; each one is
+        embedded server-side in a single provider call. Each batch is committed
+        on its own: after a failed batch no new batches are sent, and the error
+        reports which records were created so the import can be resumed.
+
+        Args:
+            collection: Collection name
+            data: List of record data dicts (JSON fields only, no files)
+            batch_size: Records per request (the server accepts up to 500)
+            max_concurrency: Maximum batches sent at the same time
+
+        Returns:
+            IDs of the created records, in the same order as ``data``
+
+        Raises:
+            ValueError: If batch_size or max_concurrency is not positive
+            CortexDBPartialWriteError: If any batch failed; ``created_ids`` holds
+                the ID of every record that was created (None for the rest)
+
+        Example:
+            >>> ids = await client.records.create_many(
+            ...     collection="documents",
+            ...     data=[{"title": f"Doc {i}", "content": "..."} for i in range(1000)],
+            ...     batch_size=100,
+            ... )
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        created: List[Optional[str]] = [None] * len(data)
+        errors: List[CortexDBError] = []
+
+        async def send(start: int) -> None:
+            async with semaphore:
+                if errors:
+                    return
+                try:
+                    ids = await self.bulk_create(collection, data[start : start + batch_size])
+                except CortexDBError as e:
+                    errors.append(e)
+                    return
+                created[start : start + len(ids)] = ids
+
+        await asyncio.gather(*(send(start) for start in range(0, len(data), batch_size)))
+
+        if errors:
+            done = sum(record_id is not None for record_id in created)
+            raise CortexDBPartialWriteError(
+                f"{len(errors)} batch(es) failed; {done} of {len(data)} records were created",
+                created,
+                errors,
+            )
+        return [record_id for record_id in created if record_id is not None]
+
     async def get(self, collection: str, record_id: str) -> Record:
         """Get a record by ID.
 
@@ -132,27 +226,16 @@ class RecordsAPI:
         if files:
             # Multipart form data
             form_data = data.copy()
-            file_objects = {}
-
-            for field_name, file_value in files.items():
-                if isinstance(file_value, (str, Path)):
-                    file_path = Path(file_value)
-                    file_objects[field_name] = open(file_path, "rb")
-                elif isinstance(file_value, bytes):
-                    file_objects[field_name] = file_value
-                else:
-                    file_objects[field_name] = file_value
-
-            response = await self._http.patch(
-                f"/collections/{collection}/records/{record_id}",
-                data=form_data,
-                files=file_objects,
-            )
-
-            # Close file handles
-            for file_obj in file_objects.values():
-                if hasattr(file_obj, "close"):
-                    file_obj.close()
+            file_objects = self._open_files(files)
+
+            try:
+                response = await self._http.patch(
+                    f"/collections/{collection}/records/{record_id}",
+                    data=form_data,
+                    files=file_objects,
+                )
+            finally:
+                self._close_files(file_objects)
         else:
             # JSON request
             response = await self._http.patch(
@@ -160,6 +243,8 @@ class RecordsAPI:
                 json=data,
             )
 
+        self._notify_write(collection)
+
         # Update returns only ID - fetch the full record
         return await self.get(collection, record_id)
 
@@ -174,6 +259,7 @@ class RecordsAPI:
             CortexDBNotFoundError: If record doesn't exist
         """
         await self._http.delete(f"/collections/{collection}/records/{record_id}")
+        self._notify_write(collection)
 
     async def query(
         self,
@@ -219,6 +305,48 @@ class RecordsAPI:
             for item in response.get("results", [])
         ]
 
+    async def query_stream(
+        self,
+        collection: str,
+        query: str,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[SearchResult]:
+        """Semantic search that yields results as the server produces them.
+
+        Uses the streaming search endpoint, so the first result can be handled
+        before the rest of the top-k has been loaded.
+
+        Args:
+            collection: Collection name
+            query: Search query text
+            limit: Maximum results to return (1-100)
+            filters: Optional filter conditions
+
+        Yields:
+            Search results in descending score order; ``data`` holds the record fields
+
+        Example:
+            >>> async for result in client.records.query_stream(
+            ...     collection="documents",
+            ...     query="machine learning applications",
+            ...     limit=5,
+            ... ):
+            ...     print(f"{result.score:.3f} - {result.data['title']}")
+        """
+        request = QueryRequest(query=query, limit=limit, filters=filters)
+
+        async for item in self._http.stream_lines(
+            "POST",
+            f"/collections/{collection}/search/stream",
+            json=request.model_dump(exclude_none=True),
+        ):
+            yield SearchResult(
+                id=item["id"],
+                score=item["score"],
+                data=item.get("record", {}),
+            )
+
     async def get_vectors(self, collection: str, record_id: str) -> List[VectorChunk]:
         """Get vectorized chunks for a record.
 
@@ -238,6 +366,36 @@ class RecordsAPI:
 
         return [VectorChunk(**chunk) for chunk in response.get("vectors", [])]
 
+    async def get_vectors_batch(
+        self, collection: str, record_ids: List[str]
+    ) -> Dict[str, List[VectorChunk]]:
+        """Get vectorized chunks for several records in one request.
+
+        Args:
+            collection: Collection name
+            record_ids: Record IDs (at most 500)
+
+        Returns:
+            Dict mapping each record ID to its chunks (empty if it has none)
+
+        Raises:
+            CortexDBNotFoundError: If collection doesn't exist
+
+        Example:
+            >>> chunks_by_id = await client.records.get_vectors_batch(
+            ...     "documents", [first.id, second.id]
+            ... )
+        """
+        response = await self._http.post(
+            f"/collections/{collection}/records/vectors/batch",
+            json={"record_ids": record_ids},
+        )
+
+        return {
+            record_id: [VectorChunk(**chunk) for chunk in chunks]
+            for record_id, chunks in response.get("vectors", {}).items()
+        }
+
     async def download_file(
         self,
         collection: str,
@@ -292,3 +450,26 @@ class RecordsAPI:
             output_file.write_bytes(content)
 
         return content
+
+    @staticmethod
+    def _open_files(files: Dict[str, Union[str, Path, bytes]]) -> Dict[str, Any]:
+        """Open file paths for upload; httpx streams open file objects in chunks."""
+        file_objects: Dict[str, Any] = {}
+        try:
+            for field_name, file_value in files.items():
+                if isinstance(file_value, (str, Path)):
+                    file_objects[field_name] = open(Path(file_value), "rb")
+                else:
+                    # Bytes or an already open file object
+                    file_objects[field_name] = file_value
+        except Exception:
+            RecordsAPI._close_files(file_objects)
+            raise
+        return file_objects
+
+    @staticmethod
+    def _close_files(file_objects: Dict[str, Any]) -> None:
+        """Close file handles opened by _open_files."""
+        for file_obj in file_objects.values():
+            if hasattr(file_obj, "close"):
+                file_obj.close()
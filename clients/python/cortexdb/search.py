@@ -0,0 +1,254 @@
+"""Search API for CortexDB."""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from .http_client import HTTPClient
+from .models import QueryRequest, SearchResult
+
+# (collection, query, limit, canonical filters and ANN params, semantic cache threshold)
+_CacheKey = Tuple[str, str, int, str, Optional[float]]
+
+
+class SearchAPI:
+    """API for semantic search."""
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+        semantic_cache_threshold: Optional[float] = None,
+    ):
+        """Initialize Search API.
+
+        Args:
+            http_client: HTTP client instance
+            cache_size: Maximum responses kept for ``use_cache=True`` searches
+            cache_ttl: Seconds a cached response stays valid
+            semantic_cache_threshold: Default similarity threshold sent to the
+                gateway's semantic cache (gateway default if None)
+        """
+        self._http = http_client
+        self._semantic_cache_threshold = semantic_cache_threshold
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._cache: OrderedDict[_CacheKey, Tuple[float, List[SearchResult]]] = OrderedDict()
+        # Identical concurrent searches share one request
+        self._inflight: Dict[_CacheKey, asyncio.Task[List[SearchResult]]] = {}
+        # Bumped by invalidate(); responses fetched before a write are not cached
+        self._epoch = 0
+        self._generations: Dict[str, int] = {}
+
+    async def semantic_search(
+        self,
+        collection: str,
+        query: str,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        semantic_cache_threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        quantization: Optional[Literal["none", "int8"]] = None,
+        rescore: Optional[bool] = None,
+    ) -> List[SearchResult]:
+        """Hybrid semantic search over a collection's vectorized fields.
+
+        Args:
+            collection: Collection name
+            query: Search query text
+            limit: Maximum results to return (1-100)
+            filters: Optional filter conditions
+            use_cache: Reuse the response of an identical recent search from this
+                client instead of calling the gateway. Writes made through this
+                client invalidate the collection's entries; writes from other
+                clients are only seen once the entry expires.
+            semantic_cache_threshold: Minimum cosine similarity between this query
+                and a previous one for the gateway to reuse its response, when the
+                gateway's semantic cache is enabled. Overrides the client default.
+            ef_search: HNSW candidate list size; lower is faster, higher finds
+                more of the true nearest neighbours (collection default if None)
+            quantization: ``"int8"`` searches the collection's int8-quantized
+                vectors (gateway started with ``QDRANT_SCALAR_QUANTIZATION=true``),
+                ``"none"`` only the original vectors
+            rescore: Re-rank int8 candidates with the original vectors
+
+        Searches with any ANN parameter set bypass the gateway's semantic cache.
+        A search identical to one still in flight from this client waits for
+        that request's response instead of sending its own.
+
+        Returns:
+            List of search results, ``data`` holding the record fields
+
+        Raises:
+            CortexDBNotFoundError: If the collection doesn't exist or has no vectors
+
+        Example:
+            >>> results = await client.search.semantic_search(
+            ...     collection="documents",
+            ...     query="programming language",
+            ...     limit=5,
+            ... )
+            >>> for result in results:
+            ...     print(f"{result.score:.3f} - {result.data['title']}")
+            >>> fast = await client.search.semantic_search(
+            ...     collection="documents",
+            ...     query="programming language",
+            ...     ef_search=32,
+            ...     quantization="int8",
+            ...     rescore=True,
+            ... )
+        """
+        ann = {
+            name: value
+            for name, value in (
+                ("ef_search", ef_search),
+                ("quantization", quantization),
+                ("rescore", rescore),
+            )
+            if value is not None
+        }
+        threshold = self._threshold(semantic_cache_threshold)
+        key: _CacheKey = (
+            collection,
+            query,
+            limit,
+            json.dumps([filters or {}, ann], sort_keys=True, default=str),
+            threshold,
+        )
+        if use_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                created_at, results = cached
+                if time.monotonic() - created_at < self._cache_ttl:
+                    self._cache.move_to_end(key)
+                    return list(results)
+                del self._cache[key]
+
+        request = QueryRequest(query=query, limit=limit, filters=filters)
+        payload = request.model_dump(exclude_none=True)
+        payload.update(ann)
+        if threshold is not None:
+            payload["semantic_cache_threshold"] = threshold
+
+        # In-flight requests are dropped on invalidate(), so one found here was sent
+        # after the last write, as was one sent now
+        generation = self._generation(collection)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._post_search(collection, payload))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        # Shielded so one caller's cancellation doesn't cancel the others' request
+        results = await asyncio.shield(task)
+
+        if use_cache and generation == self._generation(collection):
+            self._cache[key] = (time.monotonic(), results)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return list(results)
+
+    async def semantic_search_batch(
+        self,
+        collection: str,
+        queries: List[str],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        semantic_cache_threshold: Optional[float] = None,
+    ) -> List[List[SearchResult]]:
+        """Run several semantic searches in one request.
+
+        The gateway embeds all queries with a single provider call and searches
+        them concurrently, so N queries cost one round trip instead of N.
+
+        Args:
+            collection: Collection name
+            queries: Search query texts (at most 100)
+            limit: Maximum results per query (1-100)
+            filters: Optional filter conditions applied to every query
+            semantic_cache_threshold: Same as in ``semantic_search``
+
+        Returns:
+            One list of search results per query, in the order of ``queries``
+
+        Raises:
+            CortexDBNotFoundError: If the collection doesn't exist or has no vectors
+
+        Example:
+            >>> batches = await client.search.semantic_search_batch(
+            ...     collection="documents",
+            ...     queries=["programming language", "coding languages"],
+            ...     limit=5,
+            ... )
+            >>> for query_results in batches:
+            ...     print([result.data["title"] for result in query_results])
+        """
+        payload: Dict[str, Any] = {"queries": queries, "limit": limit}
+        if filters is not None:
+            payload["filters"] = filters
+        threshold = self._threshold(semantic_cache_threshold)
+        if threshold is not None:
+            payload["semantic_cache_threshold"] = threshold
+
+        response = await self._http.post(
+            f"/collections/{collection}/search/batch",
+            json=payload,
+        )
+
+        return [self._parse_results(item) for item in response.get("results", [])]
+
+    async def _post_search(self, collection: str, payload: Dict[str, Any]) -> List[SearchResult]:
+        response = await self._http.post(
+            f"/collections/{collection}/search",
+            json=payload,
+        )
+        return self._parse_results(response)
+
+    def _finish_inflight(
+        self, key: _CacheKey, task: "asyncio.Task[List[SearchResult]]"
+    ) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Retrieve the exception so it isn't logged when every waiter was cancelled
+            task.exception()
+
+    def _threshold(self, semantic_cache_threshold: Optional[float]) -> Optional[float]:
+        if semantic_cache_threshold is not None:
+            return semantic_cache_threshold
+        return self._semantic_cache_threshold
+
+    def _generation(self, collection: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(collection, 0)
+
+    @staticmethod
+    def _parse_results(response: Dict[str, Any]) -> List[SearchResult]:
+        return [
+            SearchResult(
+                id=item["id"],
+                score=item["score"],
+                data=item.get("record", {}),
+            )
+            for item in response.get("results", [])
+        ]
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """Drop cached search responses for a collection, or all of them.
+
+        Args:
+            collection: Collection name, or None to clear the whole cache
+        """
+        if collection is None:
+            self._epoch += 1
+            self._cache.clear()
+            self._inflight.clear()
+            return
+        self._generations[collection] = self._generations.get(collection, 0) + 1
+        for key in [key for key in self._cache if key[0] == collection]:
+            del self._cache[key]
+        # Searches started after a write must not join a request sent before it
+        for key in [key for key in self._inflight if key[0] == collection]:
+            del self._inflight[key]
@@ -51,8 +51,29 @@ async def test_create_and_list_collections():
         collections = await client.collections.list()
         assert any(c.name == "test_collection" for c in collections)
 
+        assert await client.collections.exists("test_collection")
+
         # Cleanup
         await client.collections.delete("test_collection")
+        assert not await client.collections.exists("test_collection")
+        await client.collections.delete("test_collection", ignore_missing=True)
+
+
+@pytest.mark.asyncio
+async def test_create_or_replace_collection():
+    """Test replacing a collection in a single request."""
+    async with CortexClient("http://localhost:8000") as client:
+        fields = [FieldDefinition(name="title", type=FieldType.STRING)]
+        await client.collections.create_or_replace(name="test_replace", fields=fields)
+
+        schema = await client.collections.create_or_replace(
+            name="test_replace",
+            fields=fields + [FieldDefinition(name="year", type=FieldType.INT)],
+        )
+        assert [field.name for field in schema.fields] == ["title", "year"]
+
+        # Cleanup
+        await client.collections.delete("test_replace")
 
 
 @pytest.mark.asyncio
@@ -123,3 +144,84 @@ async def test_query_records():
 
         # Cleanup
         await client.collections.delete("test_search")
+
+
+@pytest.mark.asyncio
+async def test_query_stream_records():
+    """Test streaming semantic search."""
+    async with CortexClient("http://localhost:8000") as client:
+        await client.collections.create(
+            name="test_search_stream",
+            fields=[
+                FieldDefinition(name="title", type=FieldType.STRING),
+                FieldDefinition(name="content", type=FieldType.TEXT, vectorize=True),
+            ],
+        )
+
+        await client.records.create(
+            collection="test_search_stream",
+            data={"title": "ML", "content": "Machine learning is amazing"},
+        )
+
+        scores = []
+        async for result in client.records.query_stream(
+            collection="test_search_stream",
+            query="artificial intelligence",
+            limit=10,
+        ):
+            assert result.id is not None
+            scores.append(result.score)
+
+        assert scores == sorted(scores, reverse=True)
+
+        # Cleanup
+        await client.collections.delete("test_search_stream")
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_records():
+    """Test creating several records in one request."""
+    async with CortexClient("http://localhost:8000") as client:
+        await client.collections.create(
+            name="test_bulk",
+            fields=[
+                FieldDefinition(name="title", type=FieldType.STRING),
+            ],
+        )
+
+        ids = await client.records.bulk_create(
+            collection="test_bulk",
+            data=[{"title": "One"}, {"title": "Two"}, {"title": "Three"}],
+        )
+
+        assert len(ids) == 3
+        fetched = await client.records.get("test_bulk", ids[1])
+        assert fetched.data["title"] == "Two"
+
+        # Cleanup
+        await client.collections.delete("test_bulk")
+
+
+@pytest.mark.asyncio
+async def test_create_many_records():
+    """Test creating records across several batches."""
+    async with CortexClient("http://localhost:8000") as client:
+        await client.collections.create_or_replace(
+            name="test_create_many",
+            fields=[
+                FieldDefinition(name="title", type=FieldType.STRING),
+            ],
+        )
+
+        ids = await client.records.create_many(
+            collection="test_create_many",
+            data=[{"title": f"Doc {i}"} for i in range(5)],
+            batch_size=2,
+        )
+
+        assert len(ids) == 5
+        fetched = await client.records.get("test_create_many", ids[4])
+        assert fetched.data["title"] == "Doc 4"
+
+        # Cleanup
+        await client.collections.delete("test_create_many")
@@ -0,0 +1,191 @@
+"""Tests for the client-side search cache and in-flight coalescing."""
+
+import asyncio
+
+import pytest
+
+from cortexdb import search as search_module
+from cortexdb.search import SearchAPI
+
+
+class FakeHTTP:
+    """Stands in for HTTPClient; answers /search and counts the requests."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = None
+
+    async def post(self, path, json=None):
+        self.calls.append((path, json))
+        if self.release is not None:
+            await self.release.wait()
+        return {
+            "results": [
+                {"id": f"r{len(self.calls)}", "score": 0.9, "record": {"title": json["query"]}}
+            ]
+        }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(search_module, "time", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_cached_search_skips_the_gateway():
+    """An identical search with use_cache is answered from the cache."""
+    http = FakeHTTP()
+    search = SearchAPI(http)
+
+    first = await search.semantic_search("docs", "python", use_cache=True)
+    second = await search.semantic_search("docs", "python", use_cache=True)
+
+    assert len(http.calls) == 1
+    assert [r.id for r in second] == [r.id for r in first]
+    assert second[0].data == {"title": "python"}
+
+
+@pytest.mark.asyncio
+async def test_search_without_cache_always_calls_the_gateway():
+    """Searches without use_cache neither read nor fill the cache."""
+    http = FakeHTTP()
+    search = SearchAPI(http)
+
+    await search.semantic_search("docs", "python")
+    await search.semantic_search("docs", "python", use_cache=True)
+    await search.semantic_search("docs", "python")
+
+    assert len(http.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_key_covers_the_request():
+    """Different filters, limits or thresholds are different cache entries."""
+    http = FakeHTTP()
+    search = SearchAPI(http)
+
+    await search.semantic_search("docs", "python", use_cache=True)
+    await search.semantic_search("docs", "python", limit=5, use_cache=True)
+    await search.semantic_search("docs", "python", filters={"lang": "en"}, use_cache=True)
+    await search.semantic_search("docs", "python", semantic_cache_threshold=0.9, use_cache=True)
+
+    assert len(http.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_entries_expire(clock):
+    """Entries older than cache_ttl are fetched again."""
+    http = FakeHTTP()
+    search = SearchAPI(http, cache_ttl=30)
+
+    await search.semantic_search("docs", "python", use_cache=True)
+    clock.now += 29
+    await search.semantic_search("docs", "python", use_cache=True)
+    assert len(http.calls) == 1
+
+    clock.now += 2
+    await search.semantic_search("docs", "python", use_cache=True)
+    assert len(http.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    """Beyond cache_size, the least recently used response is dropped."""
+    http = FakeHTTP()
+    search = SearchAPI(http, cache_size=2)
+
+    await search.semantic_search("docs", "a", use_cache=True)
+    await search.semantic_search("docs", "b", use_cache=True)
+    await search.semantic_search("docs", "a", use_cache=True)
+    await search.semantic_search("docs", "c", use_cache=True)
+    assert len(http.calls) == 3
+
+    await search.semantic_search("docs", "a", use_cache=True)
+    assert len(http.calls) == 3
+    await search.semantic_search("docs", "b", use_cache=True)
+    assert len(http.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_collection_entries():
+    """invalidate() clears one collection, or everything without an argument."""
+    http = FakeHTTP()
+    search = SearchAPI(http)
+
+    await search.semantic_search("docs", "python", use_cache=True)
+    await search.semantic_search("other", "python", use_cache=True)
+
+    search.invalidate("docs")
+    await search.semantic_search("docs", "python", use_cache=True)
+    await search.semantic_search("other", "python", use_cache=True)
+    assert len(http.calls) == 3
+
+    search.invalidate()
+    await search.semantic_search("other", "python", use_cache=True)
+    assert len(http.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_request():
+    """Identical searches in flight at the same time send a single request."""
+    http = FakeHTTP()
+    http.release = asyncio.Event()
+    search = SearchAPI(http)
+
+    pending = [
+        asyncio.ensure_future(search.semantic_search("docs", "python")) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    http.release.set()
+    results = await asyncio.gather(*pending)
+
+    assert len(http.calls) == 1
+    assert {r[0].id for r in results} == {"r1"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_shared_request():
+    """One caller giving up leaves the request running for the others."""
+    http = FakeHTTP()
+    http.release = asyncio.Event()
+    search = SearchAPI(http)
+
+    first = asyncio.ensure_future(search.semantic_search("docs", "python"))
+    second = asyncio.ensure_future(search.semantic_search("docs", "python"))
+    await asyncio.sleep(0)
+    first.cancel()
+    http.release.set()
+
+    assert (await second)[0].id == "r1"
+    assert len(http.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_during_search_is_not_cached_or_joined():
+    """A response raced by invalidate() is not cached, and later searches resend."""
+    http = FakeHTTP()
+    http.release = asyncio.Event()
+    search = SearchAPI(http)
+
+    before = asyncio.ensure_future(search.semantic_search("docs", "python", use_cache=True))
+    await asyncio.sleep(0)
+    search.invalidate("docs")
+    after = asyncio.ensure_future(search.semantic_search("docs", "python", use_cache=True))
+    await asyncio.sleep(0)
+    http.release.set()
+    await asyncio.gather(before, after)
+    assert len(http.calls) == 2
+
+    http.release = None
+    await search.semantic_search("docs", "python", use_cache=True)
+    assert len(http.calls) == 2
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from ..core.collections import CollectionService, CollectionCreationResult, get_collection_service
 from ..core.databases import get_database_service, DatabaseService
@@ -33,6 +33,35 @@ async def create_collection(request: Request, service: CollectionService = Depen
     }
 
 
+@router.put("/{name}")
+async def create_or_replace_collection(
+    name: str, request: Request, service: CollectionService = Depends(get_service)
+):
+    """Create a collection, dropping any existing collection with the same name first."""
+    body = await request.body()
+    try:
+        schema = parse_schema(body.decode("utf-8"))
+    except SchemaParseError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if schema.name != name:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Schema name '{schema.name}' does not match path '{name}'",
+        )
+
+    try:
+        result, replaced = await service.create_or_replace_collection(schema)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return {
+        "status": "replaced" if replaced else "created",
+        "collection": schema.name,
+        "postgres_table": result.postgres_table,
+        "qdrant_collection": result.qdrant_collection,
+        "minio_bucket": result.minio_bucket,
+    }
+
+
 @router.get("")
 async def list_collections(service: CollectionService = Depends(get_service)):
     rows = await service.list_collections()
@@ -56,10 +85,25 @@ async def get_collection(name: str, service: CollectionService = Depends(get_ser
     return schema.model_dump()
 
 
+@router.head("/{name}")
+async def collection_exists(name: str, service: CollectionService = Depends(get_service)):
+    """Existence probe: 200 if the collection exists, 404 otherwise, no body."""
+    schema = await service.get_collection_schema(name)
+    if not schema:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+    return Response(status_code=status.HTTP_200_OK)
+
+
 @router.delete("/{name}")
-async def delete_collection(name: str, service: CollectionService = Depends(get_service)):
+async def delete_collection(
+    name: str,
+    ignore_missing: bool = False,
+    service: CollectionService = Depends(get_service),
+):
     schema = await service.get_collection_schema(name)
     if not schema:
+        if ignore_missing:
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found")
     await service.delete_collection(name)
     return {"status": "deleted"}
@@ -158,6 +202,7 @@ async def get_database_collection(
 async def delete_database_collection(
     database: str,
     name: str,
+    ignore_missing: bool = False,
     service: CollectionService = Depends(get_service),
     db_service: DatabaseService = Depends(get_database_service),
 ):
@@ -172,6 +217,8 @@ async def delete_database_collection(
 
     schema = await service.get_collection_schema(name)
     if not schema or schema.database != database:
+        if ignore_missing:
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found")
     await service.delete_collection(name)
     return {"status": "deleted"}
@@ -7,6 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, stat
 from fastapi.responses import StreamingResponse
 
 from ..core.records import RecordService, get_record_service
+from ..models.record import BatchCreateRequest, BatchVectorsRequest
+from ..utils.responses import negotiate
 
 router = APIRouter(prefix="/collections/{collection}/records", tags=["records"])
 
@@ -53,6 +55,35 @@ async def create_record(collection: str, request: Request, service: RecordServic
     return result
 
 
+@router.post("/batch", status_code=status.HTTP_201_CREATED)
+async def create_records_batch(
+    collection: str,
+    request: BatchCreateRequest,
+    service: RecordService = Depends(get_service),
+):
+    """Create several JSON records in a single request"""
+    try:
+        results = await service.create_records(collection, request.records)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return {"records": results, "total": len(results)}
+
+
+@router.post("/vectors/batch")
+async def get_records_vectors(
+    collection: str,
+    request: BatchVectorsRequest,
+    http_request: Request,
+    service: RecordService = Depends(get_service),
+):
+    """Get the vector chunks of several records in a single request"""
+    try:
+        vectors = await service.get_records_vectors(collection, request.record_ids)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    return negotiate(http_request, {"vectors": vectors})
+
+
 @router.get("/{record_id}")
 async def get_record(collection: str, record_id: str, service: RecordService = Depends(get_service)):
     try:
@@ -76,13 +107,15 @@ async def update_record(collection: str, record_id: str, request: Request, servi
 
 
 @router.get("/{record_id}/vectors")
-async def get_record_vectors(collection: str, record_id: str, service: RecordService = Depends(get_service)):
+async def get_record_vectors(
+    collection: str, record_id: str, http_request: Request, service: RecordService = Depends(get_service)
+):
     """Get all vector chunks for a record"""
     try:
         vectors = await service.get_record_vectors(collection, record_id)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    return {"vectors": vectors}
+    return negotiate(http_request, {"vectors": vectors})
 
 
 @router.get("/{record_id}/files/{field_name}")
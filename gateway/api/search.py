@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from ..core.postgres import get_postgres_client
+from ..core.qdrant import build_search_params, supports_like_pattern
 from ..core.search import SearchService, get_search_service
-from ..models.record import QueryRequest, SearchRequest
+from ..models.record import BatchSearchRequest, QueryRequest, SearchRequest
+from ..utils.responses import negotiate
 
 router = APIRouter(prefix="/collections/{collection}", tags=["search"])
 
@@ -13,16 +19,91 @@ def get_service() -> SearchService:
     return get_search_service()
 
 
+def validate_filters(filters: Optional[Dict[str, Any]], vector_search: bool = True) -> None:
+    """Reject operands the filter backends cannot translate before any query runs.
+
+    Vector searches filter in Qdrant, which supports fewer $like shapes than the
+    Postgres /query path; a pattern it cannot apply is an error, not a dropped filter.
+    """
+    for key, value in (filters or {}).items():
+        if not isinstance(value, dict) or "$like" not in value:
+            continue
+        pattern = value["$like"]
+        if not isinstance(pattern, str):
+            raise HTTPException(status_code=400, detail=f"$like on '{key}' expects a string pattern")
+        if vector_search and not supports_like_pattern(pattern):
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"$like on '{key}' supports only exact values and '%text%' in search; "
+                    "use /query for other patterns"
+                ),
+            )
+
+
 @router.post("/search")
-async def hybrid_search(collection: str, request: SearchRequest, service: SearchService = Depends(get_service)):
+async def hybrid_search(
+    collection: str, request: SearchRequest, http_request: Request, service: SearchService = Depends(get_service)
+):
+    validate_filters(request.filters)
+    try:
+        response = await service.hybrid_search(
+            collection,
+            request.query,
+            request.filters,
+            request.limit,
+            request.semantic_cache_threshold,
+            build_search_params(request.ef_search, request.quantization, request.rescore),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    return negotiate(http_request, response)
+
+
+@router.post("/search/batch")
+async def hybrid_search_batch(
+    collection: str,
+    request: BatchSearchRequest,
+    http_request: Request,
+    service: SearchService = Depends(get_service),
+):
+    """Run several /search queries with one request; queries are embedded together"""
+    validate_filters(request.filters)
+    try:
+        response = await service.batch_search(
+            collection, request.queries, request.filters, request.limit, request.semantic_cache_threshold
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    return negotiate(http_request, response)
+
+
+@router.post("/search/stream")
+async def hybrid_search_stream(collection: str, request: SearchRequest, service: SearchService = Depends(get_service)):
+    """Same as /search, but writes each result as an NDJSON line as soon as it is ready"""
+    validate_filters(request.filters)
     try:
-        return await service.hybrid_search(collection, request.query, request.filters, request.limit)
+        results = await service.stream_search(
+            collection,
+            request.query,
+            request.filters,
+            request.limit,
+            request.semantic_cache_threshold,
+            build_search_params(request.ef_search, request.quantization, request.rescore),
+        )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
 
+    async def ndjson_lines():
+        async for result in results:
+            yield json.dumps(result, default=str) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 
 @router.post("/query")
 async def query_records(collection: str, request: QueryRequest):
+    validate_filters(request.filters, vector_search=False)
     postgres = get_postgres_client()
     results = await postgres.query_records(collection, request.filters, request.limit, request.offset)
     return {
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..models.schema import CollectionSchema, FieldDefinition, StoreLocation
 from ..utils.logger import get_logger
@@ -9,6 +9,7 @@ from .embeddings import get_embedding_service
 from .minio import get_minio_service
 from .postgres import PostgresClient, get_postgres_client
 from .qdrant import QdrantService, get_qdrant_service
+from .semantic_cache import get_semantic_cache
 
 logger = get_logger(__name__)
 
@@ -64,28 +65,33 @@ class CollectionService:
         self._qdrant = qdrant or get_qdrant_service()
         self._minio = minio or get_minio_service()
 
-    async def create_collection(self, schema: CollectionSchema) -> CollectionCreationResult:
+    async def create_collection(
+        self, schema: CollectionSchema, vector_size: Optional[int] = None
+    ) -> CollectionCreationResult:
+        """Create the Postgres table, Qdrant collection and bucket for ``schema``.
+
+        ``vector_size`` skips the provider lookup when the caller already resolved it.
+        If a step after the table fails, the table and Qdrant collection are removed.
+        """
+        if vector_size is None:
+            vector_size = await self._resolve_vector_size(schema)
         await self._postgres.create_table_from_schema(schema)
 
         qdrant_collection = None
-        if collection_requires_vectors(schema):
-            # Require embedding provider when vectorization is enabled
-            if not schema.config or not schema.config.embedding_provider_id:
-                raise ValueError(
-                    "Embedding provider is required when 'vectorize=True' is used. "
-                    "Please configure an embedding provider in settings or remove vectorize=True from your fields."
-                )
-            embedding_service = await get_embedding_service(schema.config.embedding_provider_id)
-            vector_size = await embedding_service.get_dimension()
-            qdrant_name = get_qdrant_collection_name(schema.name, schema.database)
-            await self._qdrant.create_collection_by_name(qdrant_name, vector_size)
-            qdrant_collection = qdrant_name
-
         minio_bucket = None
-        if collection_requires_minio(schema):
-            bucket = default_bucket_name(schema.name, schema.database)
-            await self._minio.ensure_bucket(bucket)
-            minio_bucket = bucket
+        try:
+            if vector_size is not None:
+                qdrant_name = get_qdrant_collection_name(schema.name, schema.database)
+                await self._qdrant.create_collection_by_name(qdrant_name, vector_size)
+                qdrant_collection = qdrant_name
+
+            if collection_requires_minio(schema):
+                bucket = default_bucket_name(schema.name, schema.database)
+                await self._minio.ensure_bucket(bucket)
+                minio_bucket = bucket
+        except Exception:
+            await self._rollback_creation(schema.name, qdrant_collection)
+            raise
 
         return CollectionCreationResult(
             postgres_table=schema.name,
@@ -93,11 +99,48 @@ class CollectionService:
             minio_bucket=minio_bucket,
         )
 
+    async def create_or_replace_collection(
+        self, schema: CollectionSchema
+    ) -> Tuple[CollectionCreationResult, bool]:
+        """Drop the collection if it already exists, then create it from ``schema``.
+
+        The embedding provider and vector size are resolved before anything is
+        dropped, so a schema that cannot be created leaves the existing collection
+        untouched. Returns the creation result and whether a collection was replaced.
+        """
+        vector_size = await self._resolve_vector_size(schema)
+        replaced = await self.get_collection_schema(schema.name) is not None
+        if replaced:
+            await self.delete_collection(schema.name)
+        return await self.create_collection(schema, vector_size), replaced
+
+    async def _resolve_vector_size(self, schema: CollectionSchema) -> Optional[int]:
+        """Return the embedding dimension for vectorized schemas, None otherwise."""
+        if not collection_requires_vectors(schema):
+            return None
+        # Require embedding provider when vectorization is enabled
+        if not schema.config or not schema.config.embedding_provider_id:
+            raise ValueError(
+                "Embedding provider is required when 'vectorize=True' is used. "
+                "Please configure an embedding provider in settings or remove vectorize=True from your fields."
+            )
+        embedding_service = await get_embedding_service(schema.config.embedding_provider_id)
+        return await embedding_service.get_dimension()
+
+    async def _rollback_creation(self, name: str, qdrant_collection: Optional[str]) -> None:
+        try:
+            await self._postgres.drop_collection(name)
+            if qdrant_collection:
+                await self._qdrant.delete_collection(qdrant_collection)
+        except Exception as exc:  # pragma: no cover - best effort cleanup
+            logger.warning("collection_rollback_failed", extra={"collection": name, "error": str(exc)})
+
     async def delete_collection(self, name: str) -> None:
         schema = await self._postgres.get_collection_schema(name)
         if not schema:
             return
         await self._postgres.drop_collection(name)
+        get_semantic_cache().invalidate(name)
         if collection_requires_vectors(schema):
             qdrant_name = get_qdrant_collection_name(schema.name, schema.database)
             await self._qdrant.delete_collection(qdrant_name)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 from uuid import UUID
 
@@ -15,6 +16,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Per-provider LRU of search query embeddings; repeated queries skip the Gemini call
+_QUERY_CACHE_SIZE = 1024
+
+# Gemini's batchEmbedContents accepts at most 100 texts per request
+_EMBED_BATCH_SIZE = 100
+
 
 class GeminiEmbeddingService:
     """Service wrapper for generating embeddings via Gemini."""
@@ -23,6 +30,7 @@ class GeminiEmbeddingService:
         self._model_name = model
         self._api_key = api_key
         self._dimension: Optional[int] = None
+        self._query_cache: OrderedDict[str, List[float]] = OrderedDict()
 
     async def embed_text(self, text: str) -> List[float]:
         """Generate an embedding vector for a single piece of text."""
@@ -41,10 +49,61 @@ class GeminiEmbeddingService:
             logger.exception("gemini_embedding_failed", extra={"error": str(exc)})
             raise
 
+    async def embed_query(self, text: str) -> List[float]:
+        """Embed a search query, reusing the vector of an identical recent query."""
+        cached = self._query_cache.get(text)
+        if cached is not None:
+            self._query_cache.move_to_end(text)
+            return cached
+
+        vector = await self.embed_text(text)
+        self._remember_query(text, vector)
+        return vector
+
+    async def embed_queries(self, texts: Iterable[str]) -> List[List[float]]:
+        """Embed several search queries; the uncached ones share one batched request."""
+        items = list(texts)
+        # Read hits before storing the new vectors, which may evict them
+        known: Dict[str, List[float]] = {}
+        missing: List[str] = []
+        for text in dict.fromkeys(items):
+            cached = self._query_cache.get(text)
+            if cached is None:
+                missing.append(text)
+            else:
+                self._query_cache.move_to_end(text)
+                known[text] = cached
+        if missing:
+            fresh = dict(zip(missing, await self.embed_texts(missing)))
+            for text, vector in fresh.items():
+                self._remember_query(text, vector)
+            known.update(fresh)
+        return [known[text] for text in items]
+
+    def _remember_query(self, text: str, vector: List[float]) -> None:
+        self._query_cache[text] = vector
+        self._query_cache.move_to_end(text)
+        if len(self._query_cache) > _QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+
     async def embed_texts(self, texts: Iterable[str]) -> List[List[float]]:
+        """Generate embeddings for many texts, sending them in batched requests."""
+        items = list(texts)
         embeddings: List[List[float]] = []
-        for text in texts:
-            embeddings.append(await self.embed_text(text))
+        try:
+            genai.configure(api_key=self._api_key)
+            for start in range(0, len(items), _EMBED_BATCH_SIZE):
+                result = await asyncio.to_thread(
+                    genai.embed_content,
+                    model=self._model_name,
+                    content=items[start : start + _EMBED_BATCH_SIZE],
+                )
+                embeddings.extend(result["embedding"])
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.exception("gemini_embedding_failed", extra={"error": str(exc), "batch_size": len(items)})
+            raise
+        if embeddings and self._dimension is None:
+            self._dimension = len(embeddings[0])
         return embeddings
 
     async def get_dimension(self) -> int:
@@ -484,6 +484,10 @@ class PostgresClient:
                             clauses.append(f"{column} < ${param_index}")
                         case "$ne":
                             clauses.append(f"{column} <> ${param_index}")
+                        case "$like":
+                            # "%" is the only wildcard, matching the Qdrant search filter
+                            clauses.append(f"{column}::text LIKE ${param_index}")
+                            val = val.replace("\\", "\\\\").replace("_", "\\_")
                         case _:
                             continue
                     values.append(val)
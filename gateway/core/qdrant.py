@@ -25,8 +25,17 @@ class QdrantPoint:
 class QdrantService:
     """Wrapper around Qdrant client with collection-aware helpers."""
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, scalar_quantization: bool = False) -> None:
         self._client = AsyncQdrantClient(url)
+        self._quantization_config: Optional[qmodels.ScalarQuantization] = None
+        if scalar_quantization:
+            self._quantization_config = qmodels.ScalarQuantization(
+                scalar=qmodels.ScalarQuantizationConfig(
+                    type=qmodels.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
+            )
 
     async def create_collection(self, schema: CollectionSchema, vector_size: int) -> None:
         collection_name = schema.name
@@ -51,6 +60,7 @@ class QdrantService:
                 collection_name=collection_name,
                 vectors_config=vectors_config,
                 on_disk_payload=True,
+                quantization_config=self._quantization_config,
             )
             await self._client.update_collection(
                 collection_name,
@@ -104,6 +114,7 @@ class QdrantService:
                 collection_name=collection_name,
                 vectors_config=vectors_config,
                 on_disk_payload=True,
+                quantization_config=self._quantization_config,
             )
             await self._client.update_collection(
                 collection_name,
@@ -194,6 +205,7 @@ class QdrantService:
         query_vector: List[float],
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 10,
+        search_params: Optional[qmodels.SearchParams] = None,
     ) -> List[qmodels.ScoredPoint]:
         filter_obj = self._build_filter(filters)
         results = await self._client.search(
@@ -202,6 +214,7 @@ class QdrantService:
             query_filter=filter_obj,
             limit=limit,
             with_payload=True,
+            search_params=search_params,
         )
         return results
 
@@ -223,6 +236,10 @@ class QdrantService:
                         range_params["gt"] = val
                     elif op == "$lt":
                         range_params["lt"] = val
+                    elif op == "$like":
+                        like_condition = self._build_like_condition(key, val)
+                        if like_condition is not None:
+                            conditions.append(like_condition)
                 if range_params:
                     conditions.append(qmodels.FieldCondition(key=key, range=qmodels.Range(**range_params)))
             else:
@@ -233,6 +250,20 @@ class QdrantService:
 
         return qmodels.Filter(must=conditions)
 
+    @staticmethod
+    def _build_like_condition(key: str, pattern: Any) -> Optional[qmodels.FieldCondition]:
+        """Translate a SQL LIKE pattern into a payload condition applied during the vector scan.
+
+        Qdrant's text match is a substring match on fields without a full-text index, so only
+        the shapes accepted by ``supports_like_pattern`` can be expressed. As in the Postgres
+        query path, "%" is the only wildcard and "_" matches itself.
+        """
+        if not isinstance(pattern, str) or not supports_like_pattern(pattern) or not pattern.strip("%"):
+            return None
+        if "%" not in pattern:
+            return qmodels.FieldCondition(key=key, match=qmodels.MatchValue(value=pattern))
+        return qmodels.FieldCondition(key=key, match=qmodels.MatchText(text=pattern[1:-1]))
+
     def _map_payload_type(self, field: FieldDefinition) -> qmodels.PayloadSchemaType:
         if field.type == FieldType.INT:
             return qmodels.PayloadSchemaType.INTEGER
@@ -243,6 +274,40 @@ class QdrantService:
         return qmodels.PayloadSchemaType.KEYWORD
 
 
+def supports_like_pattern(pattern: str) -> bool:
+    """Whether a $like pattern can be applied during the vector scan.
+
+    Accepted: an exact value ("abc"), a contains pattern ("%abc%") and a pattern made only
+    of "%" (matches everything). Prefix, suffix and inner wildcards ("abc%", "%abc", "a%b")
+    have no payload condition equivalent.
+    """
+    if "%" not in pattern or not pattern.strip("%"):
+        return True
+    return len(pattern) > 2 and pattern.startswith("%") and pattern.endswith("%") and "%" not in pattern[1:-1]
+
+
+def build_search_params(
+    ef_search: Optional[int] = None,
+    quantization: Optional[str] = None,
+    rescore: Optional[bool] = None,
+) -> Optional[qmodels.SearchParams]:
+    """Translate request-level ANN tuning into Qdrant search params.
+
+    ``quantization="int8"`` searches the collection's int8 vectors (when it has them)
+    and, with ``rescore``, re-ranks the candidates with the original vectors;
+    ``"none"`` always searches the original vectors. Returns None when nothing is
+    set so the collection defaults apply.
+    """
+    if ef_search is None and quantization is None and rescore is None:
+        return None
+    quantization_params = None
+    if quantization == "none":
+        quantization_params = qmodels.QuantizationSearchParams(ignore=True)
+    elif quantization is not None or rescore is not None:
+        quantization_params = qmodels.QuantizationSearchParams(ignore=False, rescore=rescore)
+    return qmodels.SearchParams(hnsw_ef=ef_search, quantization=quantization_params)
+
+
 _service: Optional[QdrantService] = None
 
 
@@ -250,5 +315,7 @@ def get_qdrant_service() -> QdrantService:
     global _service
     if _service is None:
         settings = get_settings()
-        _service = QdrantService(settings.qdrant_url)
+        _service = QdrantService(
+            settings.qdrant_url, scalar_quantization=settings.qdrant_scalar_quantization
+        )
     return _service
@@ -19,6 +19,7 @@ from .embeddings import GeminiEmbeddingService, get_embedding_service
 from .minio import get_minio_service
 from .postgres import get_postgres_client
 from .qdrant import QdrantPoint, get_qdrant_service
+from .semantic_cache import get_semantic_cache
 
 logger = get_logger(__name__)
 
@@ -39,6 +40,7 @@ class RecordService:
         self._minio = get_minio_service()
         self._collections = get_collection_service()
         self._docling = get_docling_processor()
+        self._search_cache = get_semantic_cache()
 
     async def create_record(
         self,
@@ -50,14 +52,100 @@ class RecordService:
         if not schema:
             raise ValueError(f"Collection {collection_name} not found")
 
-        embedding_service: Optional[GeminiEmbeddingService] = None
-        vector_size = None
-        if collection_requires_vectors(schema):
-            embedding_service = await get_embedding_service(schema.config.embedding_provider_id)
-            vector_size = await embedding_service.get_dimension()
+        embedding_service, vector_size = await self._resolve_embedding_service(schema)
+        return await self._store_record(schema, data, files, embedding_service, vector_size)
+
+    async def create_records(
+        self,
+        collection_name: str,
+        items: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Create several JSON records in one call, resolving schema and provider once.
 
+        All or nothing: if any record fails to persist, the records already written
+        by this call are removed from Postgres and Qdrant before the error is raised.
+        """
+        schema = await self._collections.get_collection_schema(collection_name)
+        if not schema:
+            raise ValueError(f"Collection {collection_name} not found")
+
+        embedding_service, vector_size = await self._resolve_embedding_service(schema)
+        record_ids = [str(uuid.uuid4()) for _ in items]
+        prepared_records = [
+            await self._prepare_record(schema, record_id, data, {}, embedding_service)
+            for record_id, data in zip(record_ids, items)
+        ]
+
+        # One embedding request for every chunk in the batch instead of one per field per record
+        await self._embed_points(
+            [point for prepared in prepared_records for point in prepared.qdrant_points],
+            embedding_service,
+        )
+
+        results: List[Dict[str, Any]] = []
+        try:
+            for record_id, prepared in zip(record_ids, prepared_records):
+                results.append(await self._persist_record(schema, record_id, prepared, vector_size))
+        except Exception:
+            # Includes the failing record: its Postgres row may exist if Qdrant failed
+            await self._discard_records(schema, record_ids[: len(results) + 1])
+            raise
+        return results
+
+    async def _discard_records(self, schema: CollectionSchema, record_ids: List[str]) -> None:
+        """Best-effort removal of records written by a batch that failed part-way."""
+        for record_id in record_ids:
+            try:
+                if collection_requires_vectors(schema):
+                    await self._qdrant.delete_record(schema.name, record_id)
+                await self._postgres.delete_record(schema.name, record_id)
+            except Exception:  # pragma: no cover - best effort cleanup
+                logger.warning(
+                    "batch_rollback_failed", extra={"collection": schema.name, "record_id": record_id}
+                )
+        self._search_cache.invalidate(schema.name)
+
+    async def _resolve_embedding_service(
+        self, schema: CollectionSchema
+    ) -> tuple[Optional[GeminiEmbeddingService], Optional[int]]:
+        if not collection_requires_vectors(schema):
+            return None, None
+        embedding_service = await get_embedding_service(schema.config.embedding_provider_id)
+        return embedding_service, await embedding_service.get_dimension()
+
+    async def _store_record(
+        self,
+        schema: CollectionSchema,
+        data: Dict[str, Any],
+        files: Dict[str, UploadFile],
+        embedding_service: Optional[GeminiEmbeddingService],
+        vector_size: Optional[int],
+    ) -> Dict[str, Any]:
         record_id = str(uuid.uuid4())
         prepared = await self._prepare_record(schema, record_id, data, files, embedding_service)
+        await self._embed_points(prepared.qdrant_points, embedding_service)
+        return await self._persist_record(schema, record_id, prepared, vector_size)
+
+    @staticmethod
+    async def _embed_points(
+        points: List[QdrantPoint],
+        embedding_service: Optional[GeminiEmbeddingService],
+    ) -> None:
+        """Fill in the vectors of prepared points from their chunk text in one batched call."""
+        if not points or embedding_service is None:
+            return
+        vectors = await embedding_service.embed_texts([point.payload["text"] for point in points])
+        for point, vector in zip(points, vectors):
+            point.vector = vector
+
+    async def _persist_record(
+        self,
+        schema: CollectionSchema,
+        record_id: str,
+        prepared: PreparedRecord,
+        vector_size: Optional[int],
+    ) -> Dict[str, Any]:
+        collection_name = schema.name
         postgres_data = {"id": record_id, **prepared.postgres_data}
 
         try:
@@ -77,6 +165,8 @@ class RecordService:
                     logger.warning("minio_cleanup_failed", extra={"path": object_path})
             raise
 
+        self._search_cache.invalidate(collection_name)
+
         bucket = default_bucket_name(schema.name)
         files_payload: Dict[str, Any] = {}
         for field_name, object_path in prepared.file_paths.items():
@@ -136,27 +226,27 @@ class RecordService:
                     if text_fragments and (field.vectorize or StoreLocation.QDRANT in field.store_in):
                         if embedding_service is None:
                             raise ValueError("Embedding provider is not configured for vector fields")
-                        vectors = await embedding_service.embed_texts(text_fragments)
-                        for idx, vector in enumerate(vectors):
+                        for idx, fragment in enumerate(text_fragments):
                             # Generate deterministic UUID from record_id, field name, and chunk index
                             point_id_str = f"{record_id}:{field.name}:{idx}"
                             point_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, point_id_str)
 
+                            # Vector is filled in by _embed_points
                             qdrant_points.append(
                                 QdrantPoint(
                                     id=str(point_uuid),
-                                    vector=vector,
+                                    vector=[],
                                     payload={
                                         "record_id": record_id,
                                         "collection": schema.name,
                                         "field": field.name,
                                         "chunk_index": idx,
-                                        "text": text_fragments[idx],
+                                        "text": fragment,
                                         **payload_base,
                                     },
                                 )
                             )
-                        vectors_created += len(vectors)
+                        vectors_created += len(text_fragments)
                 continue
 
             if value is None:
@@ -185,26 +275,25 @@ class RecordService:
                 fragments = chunk_text(text_value, chunk_size, chunk_overlap)
                 if embedding_service is None:
                     raise ValueError("Embedding provider is not configured for vector fields")
-                vectors = await embedding_service.embed_texts(fragments)
-                for idx, vector in enumerate(vectors):
+                for idx, fragment in enumerate(fragments):
                     # Generate deterministic UUID from record_id, field name, and chunk index
                     point_id_str = f"{record_id}:{field.name}:{idx}"
                     point_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, point_id_str)
                     qdrant_points.append(
                         QdrantPoint(
                             id=str(point_uuid),
-                            vector=vector,
+                            vector=[],
                             payload={
                                 "record_id": record_id,
                                 "collection": schema.name,
                                 "field": field.name,
                                 "chunk_index": idx,
-                                "text": fragments[idx],
+                                "text": fragment,
                                 **payload_base,
                             },
                         )
                     )
-                vectors_created += len(vectors)
+                vectors_created += len(fragments)
 
         return PreparedRecord(
             postgres_data=postgres_data,
@@ -274,14 +363,7 @@ class RecordService:
             points = response[0]  # scroll returns (points, next_page_offset)
 
             # Sort by chunk_index and return
-            vectors = []
-            for point in points:
-                vectors.append({
-                    "id": point.id,
-                    "field": point.payload.get("field"),
-                    "chunk_index": point.payload.get("chunk_index"),
-                    "text": point.payload.get("text"),
-                })
+            vectors = [self._vector_chunk(point) for point in points]
 
             # Sort by chunk_index
             vectors.sort(key=lambda x: x.get("chunk_index", 0))
@@ -290,6 +372,59 @@ class RecordService:
             # Collection might not exist or no vectors
             return []
 
+    async def get_records_vectors(
+        self, collection: str, record_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the vector chunks of several records with one filtered Qdrant scroll"""
+        schema = await self._collections.get_collection_schema(collection)
+        if not schema:
+            raise ValueError(f"Collection {collection} not found")
+
+        from qdrant_client.http import models as qmodels
+
+        vectors: Dict[str, List[Dict[str, Any]]] = {record_id: [] for record_id in record_ids}
+        scroll_filter = qmodels.Filter(
+            must=[
+                qmodels.FieldCondition(
+                    key="record_id",
+                    match=qmodels.MatchAny(any=list(vectors)),
+                )
+            ]
+        )
+        offset = None
+        try:
+            while True:
+                points, offset = await self._qdrant._client.scroll(
+                    collection_name=collection,
+                    scroll_filter=scroll_filter,
+                    limit=256,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False,
+                )
+                for point in points:
+                    chunks = vectors.get(point.payload.get("record_id"))
+                    if chunks is not None:
+                        chunks.append(self._vector_chunk(point))
+                if offset is None:
+                    break
+        except Exception:
+            # Collection might not exist or no vectors
+            return {record_id: [] for record_id in vectors}
+
+        for chunks in vectors.values():
+            chunks.sort(key=lambda x: x.get("chunk_index", 0))
+        return vectors
+
+    @staticmethod
+    def _vector_chunk(point: Any) -> Dict[str, Any]:
+        return {
+            "id": point.id,
+            "field": point.payload.get("field"),
+            "chunk_index": point.payload.get("chunk_index"),
+            "text": point.payload.get("text"),
+        }
+
     async def delete_record(self, collection: str, record_id: str) -> None:
         schema = await self._collections.get_collection_schema(collection)
         if not schema:
@@ -310,6 +445,7 @@ class RecordService:
         if collection_requires_vectors(schema):
             await self._qdrant.delete_record(collection, record_id)
         await self._postgres.delete_record(collection, record_id)
+        self._search_cache.invalidate(collection)
 
     async def get_file(self, collection: str, record_id: str, field_name: str):
         """Get a file from a record's file field.
@@ -491,6 +627,8 @@ class RecordService:
         if qdrant_points:
             await self._qdrant.upsert_points(collection, qdrant_points)
 
+        self._search_cache.invalidate(collection)
+
         return {
             "id": record_id,
             "vectors_created": vectors_created,
@@ -549,10 +687,10 @@ class RecordService:
         chunk_size: int,
         chunk_overlap: int,
     ) -> tuple[str, List[str]]:
-        content = await upload.read()
-        buffer = io.BytesIO(content)
-        buffer.seek(0)
-        await upload.close()
+        # Stream the spooled upload straight to MinIO instead of copying it into memory first
+        upload.file.seek(0, io.SEEK_END)
+        length = upload.file.tell()
+        upload.file.seek(0)
 
         bucket = default_bucket_name(schema.name)
         object_path = f"{schema.name}/{record_id}/{upload.filename}"
@@ -561,11 +699,18 @@ class RecordService:
         await self._minio.upload_stream(
             bucket,
             object_path,
-            buffer,
-            length=len(content),
+            upload.file,
+            length=length,
             content_type=upload.content_type,
         )
 
+        # Only extraction needs the whole file in memory (Docling and vision take bytes)
+        content = b""
+        if field.vectorize:
+            await upload.seek(0)
+            content = await upload.read()
+        await upload.close()
+
         text_fragments: List[str] = []
         if field.vectorize:
             # Determine file type and process accordingly
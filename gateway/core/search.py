@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from qdrant_client.http import models as qmodels
 
 from ..models.schema import CollectionSchema, StoreLocation
 from .collections import collection_requires_vectors
@@ -12,6 +16,7 @@ from .embeddings import get_embedding_service
 from .minio import get_minio_service
 from .postgres import get_postgres_client
 from .qdrant import get_qdrant_service
+from .semantic_cache import get_semantic_cache
 
 logger = get_logger(__name__)
 
@@ -23,6 +28,7 @@ class SearchService:
         self._postgres = get_postgres_client()
         self._minio = get_minio_service()
         self._settings = get_settings()
+        self._cache = get_semantic_cache() if self._settings.semantic_cache_enabled else None
 
     async def hybrid_search(
         self,
@@ -30,7 +36,107 @@ class SearchService:
         query: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 10,
+        cache_threshold: Optional[float] = None,
+        search_params: Optional[qmodels.SearchParams] = None,
     ) -> Dict[str, Any]:
+        schema, embedding_service = await self._resolve_search_schema(collection)
+
+        started = time.perf_counter()
+        query_vector = await embedding_service.embed_query(query)
+        return await self._search_vector(
+            schema, query_vector, filters, limit, cache_threshold, started, search_params
+        )
+
+    async def batch_search(
+        self,
+        collection: str,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        cache_threshold: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Embed all queries in one provider call, then run their searches concurrently."""
+        schema, embedding_service = await self._resolve_search_schema(collection)
+
+        started = time.perf_counter()
+        query_vectors = await embedding_service.embed_queries(queries)
+        semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+
+        async def search(query_vector: List[float]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._search_vector(
+                    schema, query_vector, filters, limit, cache_threshold, time.perf_counter()
+                )
+
+        responses = await asyncio.gather(*(search(query_vector) for query_vector in query_vectors))
+        took_ms = (time.perf_counter() - started) * 1000
+        return {
+            "results": [{"query": query, **response} for query, response in zip(queries, responses)],
+            "total": len(responses),
+            "took_ms": round(took_ms, 2),
+        }
+
+    async def _search_vector(
+        self,
+        schema: CollectionSchema,
+        query_vector: List[float],
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        cache_threshold: Optional[float],
+        started: float,
+        search_params: Optional[qmodels.SearchParams] = None,
+    ) -> Dict[str, Any]:
+        collection = schema.name
+        # Explicit ANN tuning changes the results, so those searches bypass the cache
+        cache = self._cache if search_params is None else None
+        if cache is not None:
+            cached = cache.get(collection, query_vector, filters, limit, cache_threshold)
+            if cached is not None:
+                took_ms = (time.perf_counter() - started) * 1000
+                return {**cached, "took_ms": round(took_ms, 2), "cached": True}
+            generation = cache.generation(collection)
+
+        results = [
+            result
+            async for result in self._iter_results(schema, query_vector, filters, limit, search_params)
+        ]
+
+        took_ms = (time.perf_counter() - started) * 1000
+
+        response = {
+            "results": results,
+            "total": len(results),
+            "took_ms": round(took_ms, 2),
+        }
+        if cache is not None:
+            cache.put(collection, query_vector, filters, limit, response, generation)
+        return response
+
+    async def stream_search(
+        self,
+        collection: str,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        cache_threshold: Optional[float] = None,
+        search_params: Optional[qmodels.SearchParams] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Resolve and embed the query, then return an iterator over ranked results.
+
+        Validation happens before the iterator is returned so callers can still map
+        errors to a status code; results are yielded one by one as they are built.
+        """
+        schema, embedding_service = await self._resolve_search_schema(collection)
+        query_vector = await embedding_service.embed_query(query)
+
+        if self._cache is not None and search_params is None:
+            cached = self._cache.get(collection, query_vector, filters, limit, cache_threshold)
+            if cached is not None:
+                return self._iter_cached(cached["results"])
+
+        return self._iter_results(schema, query_vector, filters, limit, search_params)
+
+    async def _resolve_search_schema(self, collection: str) -> Tuple[CollectionSchema, Any]:
         schema = await self._collections.get_collection_schema(collection)
         if not schema:
             raise ValueError(f"Collection {collection} not found")
@@ -39,10 +145,20 @@ class SearchService:
             raise ValueError("Collection does not have vector search enabled")
 
         embedding_service = await get_embedding_service(schema.config.embedding_provider_id)
+        return schema, embedding_service
 
-        started = time.perf_counter()
-        query_vector = await embedding_service.embed_text(query)
-        qdrant_results = await self._qdrant.search(collection, query_vector, filters, limit=limit * 5)
+    async def _iter_results(
+        self,
+        schema: CollectionSchema,
+        query_vector: List[float],
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        search_params: Optional[qmodels.SearchParams] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        collection = schema.name
+        qdrant_results = await self._qdrant.search(
+            collection, query_vector, filters, limit=limit * 5, search_params=search_params
+        )
 
         aggregated: Dict[str, Dict[str, Any]] = {}
         for point in qdrant_results:
@@ -72,30 +188,24 @@ class SearchService:
         records = await self._postgres.fetch_records_by_ids(collection, record_ids)
         record_map = {str(record["id"]): record for record in records}
 
-        results: List[Dict[str, Any]] = []
         for record_id in record_ids:
             record = record_map.get(record_id)
             if not record:
                 continue
             entry = aggregated[record_id]
             files_payload = await self._generate_file_urls(schema.name, record, schema)
-            results.append(
-                {
-                    "id": record_id,
-                    "score": entry["score"],
-                    "record": self._serialize_record(record),
-                    "files": files_payload,
-                    "highlights": entry["highlights"],
-                }
-            )
-
-        took_ms = (time.perf_counter() - started) * 1000
-
-        return {
-            "results": results,
-            "total": len(results),
-            "took_ms": round(took_ms, 2),
-        }
+            yield {
+                "id": record_id,
+                "score": entry["score"],
+                "record": self._serialize_record(record),
+                "files": files_payload,
+                "highlights": entry["highlights"],
+            }
+
+    @staticmethod
+    async def _iter_cached(results: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        for result in results:
+            yield result
 
     async def _generate_file_urls(self, collection: str, record: Dict[str, Any], schema: "CollectionSchema") -> Dict[str, str]:
         bucket = default_bucket_name(collection)
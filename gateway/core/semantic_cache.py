@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.config import get_settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (collection, canonical filters, limit): only queries with identical constraints share responses
+_BucketKey = Tuple[str, str, int]
+
+
+@dataclass
+class _Bucket:
+    vectors: Optional[np.ndarray] = None  # (n, d) L2-normalized query embeddings (float32 or int8)
+    scales: Optional[np.ndarray] = None  # (n,) per-row dequantization factors when int8
+    entries: List[Tuple[float, Dict[str, Any]]] = field(default_factory=list)  # (created_at, response)
+    last_used: List[float] = field(default_factory=list)  # parallel to entries, for LRU eviction
+
+
+class SemanticCache:
+    """In-memory cache of search responses keyed by query embedding similarity.
+
+    A lookup hits when a previous query against the same collection, filters and limit
+    has a cosine similarity of at least the threshold with the new query embedding.
+    Entries expire ``ttl_seconds`` after creation; beyond ``max_entries`` in total the
+    least recently used entry is evicted.
+
+    With ``pca_components`` set, the first ``pca_fit_samples`` query embeddings are used
+    to fit a projection onto their top principal directions, and every cached embedding
+    is stored in that smaller space from then on. Embeddings are projected without
+    centering and re-normalized, so scores stay cosines the threshold applies to. The
+    fit runs in the default executor, off the event loop.
+
+    With ``int8`` set, cached embeddings are scalar-quantized per row (scaled so the
+    largest component maps to 127), storing a quarter of the float32 bytes.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        ttl_seconds: float,
+        max_entries: int,
+        pca_components: int = 0,
+        pca_fit_samples: int = 1000,
+        int8: bool = False,
+    ) -> None:
+        self._threshold = threshold
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._buckets: Dict[_BucketKey, _Bucket] = {}
+        self._size = 0
+        # Bumped by invalidate(); put() drops responses computed before a write
+        self._epoch = 0
+        self._generations: Dict[str, int] = {}
+        self._pca_components = pca_components
+        self._pca_fit_samples = pca_fit_samples
+        self._pca_samples: List[np.ndarray] = []
+        self._pca_basis: Optional[np.ndarray] = None  # (d, k) projection matrix
+        self._pca_fitting = False
+        self._int8 = int8
+
+    def get(
+        self,
+        collection: str,
+        query_vector: Sequence[float],
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        threshold: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        bucket = self._buckets.get(self._key(collection, filters, limit))
+        if bucket is None:
+            return None
+        self._expire(bucket)
+        if bucket.vectors is None or not bucket.entries:
+            return None
+
+        query = self._encode(query_vector)
+        if query.shape[0] != bucket.vectors.shape[1]:
+            return None
+
+        scores = self._scores(bucket, query)
+        best = int(np.argmax(scores))
+        if scores[best] < (self._threshold if threshold is None else threshold):
+            return None
+        bucket.last_used[best] = time.monotonic()
+        return bucket.entries[best][1]
+
+    def put(
+        self,
+        collection: str,
+        query_vector: Sequence[float],
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        response: Dict[str, Any],
+        generation: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """Cache a response unless the collection was invalidated since ``generation`` was read."""
+        if generation is not None and generation != self.generation(collection):
+            return
+        bucket = self._buckets.setdefault(self._key(collection, filters, limit), _Bucket())
+        self._expire(bucket)
+        self._observe(query_vector)
+        row, scale = self._quantize(self._encode(query_vector)[np.newaxis, :])
+        now = time.monotonic()
+
+        if bucket.vectors is None or bucket.vectors.shape[1] != row.shape[1]:
+            # First entry, or the collection's provider (and dimension) changed
+            self._size -= len(bucket.entries)
+            bucket.vectors = row
+            bucket.scales = scale
+            bucket.entries = [(now, response)]
+            bucket.last_used = [now]
+        else:
+            bucket.vectors = np.vstack([bucket.vectors, row])
+            if scale is not None and bucket.scales is not None:
+                bucket.scales = np.concatenate([bucket.scales, scale])
+            bucket.entries.append((now, response))
+            bucket.last_used.append(now)
+        self._size += 1
+
+        while self._size > self._max_entries:
+            self._evict_least_recently_used()
+
+    def generation(self, collection: str) -> Tuple[int, int]:
+        """Version of the collection's cached data, changed by every invalidate()."""
+        return self._epoch, self._generations.get(collection, 0)
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """Drop cached responses for a collection (or everything) after a write."""
+        if collection is None:
+            self._epoch += 1
+            self._buckets.clear()
+            self._size = 0
+            return
+        self._generations[collection] = self._generations.get(collection, 0) + 1
+        for key in [key for key in self._buckets if key[0] == collection]:
+            self._size -= len(self._buckets.pop(key).entries)
+
+    def _expire(self, bucket: _Bucket) -> None:
+        # Entries are appended in creation order, so expired ones form a prefix
+        cutoff = time.monotonic() - self._ttl_seconds
+        expired = 0
+        for created_at, _ in bucket.entries:
+            if created_at >= cutoff:
+                break
+            expired += 1
+        if expired:
+            self._remove(bucket, slice(0, expired), expired)
+
+    def _evict_least_recently_used(self) -> None:
+        victim: Optional[Tuple[_BucketKey, int]] = None
+        oldest = float("inf")
+        for key, bucket in self._buckets.items():
+            if not bucket.last_used:
+                continue
+            index = min(range(len(bucket.last_used)), key=bucket.last_used.__getitem__)
+            if bucket.last_used[index] < oldest:
+                oldest = bucket.last_used[index]
+                victim = (key, index)
+        if victim is None:
+            self._size = 0
+            return
+        key, index = victim
+        bucket = self._buckets[key]
+        self._remove(bucket, slice(index, index + 1), 1)
+        if not bucket.entries:
+            del self._buckets[key]
+
+    def _remove(self, bucket: _Bucket, rows: slice, count: int) -> None:
+        del bucket.entries[rows]
+        del bucket.last_used[rows]
+        if bucket.entries and bucket.vectors is not None:
+            indices = np.arange(rows.start, rows.stop)
+            bucket.vectors = np.delete(bucket.vectors, indices, axis=0)
+            if bucket.scales is not None:
+                bucket.scales = np.delete(bucket.scales, indices)
+        else:
+            bucket.vectors = None
+            bucket.scales = None
+        self._size -= count
+
+    def _quantize(self, matrix: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Return rows as stored in a bucket: float32 as-is, or int8 plus per-row scales."""
+        if not self._int8:
+            return matrix, None
+        peaks = np.abs(matrix).max(axis=1)
+        scales = np.where(peaks > 0, peaks / 127.0, 1.0).astype(np.float32)
+        return np.round(matrix / scales[:, np.newaxis]).astype(np.int8), scales
+
+    @staticmethod
+    def _dequantize(bucket: _Bucket) -> np.ndarray:
+        assert bucket.vectors is not None
+        if bucket.scales is None:
+            return bucket.vectors
+        return bucket.vectors.astype(np.float32) * bucket.scales[:, np.newaxis]
+
+    @staticmethod
+    def _scores(bucket: _Bucket, query: np.ndarray) -> np.ndarray:
+        assert bucket.vectors is not None
+        if bucket.scales is None:
+            return bucket.vectors @ query
+        # Dot products on the int8 codes, rescaled per row
+        return (bucket.vectors.astype(np.float32) @ query) * bucket.scales
+
+    def _encode(self, vector: Sequence[float]) -> np.ndarray:
+        """Normalize a query embedding and project it once the PCA basis is fitted."""
+        query = self._normalize(vector)
+        if self._pca_basis is None or query.shape[0] != self._pca_basis.shape[0]:
+            return query
+        return self._normalize(query @ self._pca_basis)
+
+    def _observe(self, vector: Sequence[float]) -> None:
+        """Collect embeddings for the PCA fit and start the fit once enough have been seen."""
+        if self._pca_basis is not None or self._pca_fitting or self._pca_components <= 0:
+            return
+        sample = self._normalize(vector)
+        if sample.shape[0] <= self._pca_components:
+            return
+        if self._pca_samples and self._pca_samples[0].shape != sample.shape:
+            self._pca_samples.clear()
+        self._pca_samples.append(sample)
+        if len(self._pca_samples) < self._pca_fit_samples:
+            return
+
+        samples = np.vstack(self._pca_samples)
+        self._pca_samples.clear()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not called from the event loop: nothing to keep responsive
+            self._install_basis(self._fit_basis(samples, self._pca_components))
+            return
+        self._pca_fitting = True
+        fit = loop.run_in_executor(None, self._fit_basis, samples, self._pca_components)
+        fit.add_done_callback(self._on_basis_fitted)
+
+    @staticmethod
+    def _fit_basis(samples: np.ndarray, components: int) -> np.ndarray:
+        _, _, vt = np.linalg.svd(samples, full_matrices=False)
+        return np.ascontiguousarray(vt[:components].T, dtype=np.float32)
+
+    def _on_basis_fitted(self, fit: asyncio.Future[np.ndarray]) -> None:
+        # Runs on the event loop thread, like every other cache access
+        self._pca_fitting = False
+        if fit.cancelled():
+            return
+        if fit.exception() is not None:
+            logger.warning("semantic_cache_pca_fit_failed", extra={"error": str(fit.exception())})
+            return
+        self._install_basis(fit.result())
+
+    def _install_basis(self, basis: np.ndarray) -> None:
+        self._pca_basis = basis
+        # Re-encode entries cached before the fit so every bucket shares one space
+        for bucket in self._buckets.values():
+            if bucket.vectors is not None and bucket.vectors.shape[1] == basis.shape[0]:
+                projected = self._dequantize(bucket) @ basis
+                norms = np.linalg.norm(projected, axis=1, keepdims=True)
+                projected = projected / np.where(norms > 0, norms, 1.0)
+                bucket.vectors, bucket.scales = self._quantize(projected.astype(np.float32))
+
+    @staticmethod
+    def _key(collection: str, filters: Optional[Dict[str, Any]], limit: int) -> _BucketKey:
+        return collection, json.dumps(filters or {}, sort_keys=True, default=str), limit
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else array
+
+
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    global _semantic_cache
+    if _semantic_cache is None:
+        settings = get_settings()
+        _semantic_cache = SemanticCache(
+            threshold=settings.semantic_cache_threshold,
+            ttl_seconds=settings.semantic_cache_ttl_seconds,
+            max_entries=settings.semantic_cache_max_entries,
+            pca_components=settings.semantic_cache_pca_components,
+            pca_fit_samples=settings.semantic_cache_pca_fit_samples,
+            int8=settings.semantic_cache_int8,
+        )
+    return _semantic_cache
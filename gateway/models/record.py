@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -9,9 +9,44 @@ class SearchRequest(BaseModel):
     query: str = Field(..., description="Natural language search query")
     filters: Optional[Dict[str, Any]] = Field(default=None, description="Optional filter map")
     limit: int = Field(default=10, ge=1, le=100)
+    semantic_cache_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum query similarity for a semantic cache hit (server default if omitted)",
+    )
+    ef_search: Optional[int] = Field(
+        default=None, ge=1, le=4096, description="HNSW candidate list size (collection default if omitted)"
+    )
+    quantization: Optional[Literal["none", "int8"]] = Field(
+        default=None, description="Search the int8-quantized vectors or only the original ones"
+    )
+    rescore: Optional[bool] = Field(
+        default=None, description="Re-rank quantized candidates with the original vectors"
+    )
+
+
+class BatchSearchRequest(BaseModel):
+    queries: List[str] = Field(..., min_length=1, max_length=100, description="Natural language search queries")
+    filters: Optional[Dict[str, Any]] = Field(default=None, description="Optional filter map applied to every query")
+    limit: int = Field(default=10, ge=1, le=100)
+    semantic_cache_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum query similarity for a semantic cache hit (server default if omitted)",
+    )
 
 
 class QueryRequest(BaseModel):
     filters: Dict[str, Any] = Field(default_factory=dict)
     limit: int = Field(default=100, ge=1, le=500)
     offset: int = Field(default=0, ge=0)
+
+
+class BatchCreateRequest(BaseModel):
+    records: List[Dict[str, Any]] = Field(..., min_length=1, max_length=500)
+
+
+class BatchVectorsRequest(BaseModel):
+    record_ids: List[str] = Field(..., min_length=1, max_length=500)
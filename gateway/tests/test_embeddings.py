@@ -0,0 +1,44 @@
+"""Tests for the query embedding cache of the Gemini embedding service."""
+
+import asyncio
+
+from gateway.core import embeddings
+from gateway.core.embeddings import GeminiEmbeddingService
+
+
+class CountingService(GeminiEmbeddingService):
+    """Embeds each text as [len(text)] and records which texts reached the provider."""
+
+    def __init__(self) -> None:
+        super().__init__(api_key="test", model="test-model")
+        self.sent = []
+
+    async def embed_texts(self, texts):
+        items = list(texts)
+        self.sent.append(items)
+        return [[float(len(text))] for text in items]
+
+
+def test_embed_queries_only_sends_uncached_texts():
+    service = CountingService()
+
+    async def run():
+        await service.embed_queries(["a", "bb"])
+        return await service.embed_queries(["bb", "ccc", "ccc"])
+
+    assert asyncio.run(run()) == [[2.0], [3.0], [3.0]]
+    assert service.sent == [["a", "bb"], ["ccc"]]
+
+
+def test_embed_queries_survives_eviction_within_one_batch(monkeypatch):
+    monkeypatch.setattr(embeddings, "_QUERY_CACHE_SIZE", 2)
+    service = CountingService()
+
+    async def run():
+        await service.embed_queries(["a", "bb"])
+        # Storing the two new vectors evicts "a", which this batch still needs
+        return await service.embed_queries(["a", "ccc", "dddd"])
+
+    assert asyncio.run(run()) == [[1.0], [3.0], [4.0]]
+    assert service.sent == [["a", "bb"], ["ccc", "dddd"]]
+    assert list(service._query_cache) == ["ccc", "dddd"]
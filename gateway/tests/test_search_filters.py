@@ -0,0 +1,44 @@
+"""Tests for $like filter validation and its translation to Qdrant conditions."""
+
+import pytest
+from fastapi import HTTPException
+
+from gateway.api.search import validate_filters
+from gateway.core.qdrant import QdrantService, supports_like_pattern
+
+
+@pytest.mark.parametrize("pattern", ["abc", "%abc%", "%a_b%", "%", "%%"])
+def test_supported_like_patterns(pattern):
+    assert supports_like_pattern(pattern)
+
+
+@pytest.mark.parametrize("pattern", ["abc%", "%abc", "a%b", "%a%b%"])
+def test_unsupported_like_patterns(pattern):
+    assert not supports_like_pattern(pattern)
+
+
+def test_search_rejects_prefix_pattern():
+    with pytest.raises(HTTPException) as exc_info:
+        validate_filters({"title": {"$like": "Intro%"}})
+    assert exc_info.value.status_code == 400
+
+
+def test_query_accepts_prefix_pattern():
+    validate_filters({"title": {"$like": "Intro%"}}, vector_search=False)
+
+
+@pytest.mark.parametrize("vector_search", [True, False])
+def test_non_string_pattern_is_rejected(vector_search):
+    with pytest.raises(HTTPException) as exc_info:
+        validate_filters({"year": {"$like": 2024}}, vector_search=vector_search)
+    assert exc_info.value.status_code == 400
+
+
+def test_contains_pattern_becomes_text_match():
+    condition = QdrantService._build_like_condition("title", "%a_b%")
+    assert condition.key == "title"
+    assert condition.match.text == "a_b"
+
+
+def test_match_all_pattern_adds_no_condition():
+    assert QdrantService._build_like_condition("title", "%") is None
@@ -0,0 +1,170 @@
+"""Tests for the gateway semantic search cache."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from gateway.core import semantic_cache
+from gateway.core.semantic_cache import SemanticCache
+
+DIM = 64
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(semantic_cache, "time", fake)
+    return fake
+
+
+def unit(seed: int, dim: int = DIM) -> np.ndarray:
+    vector = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def nearby(vector: np.ndarray, seed: int, noise: float = 0.01) -> np.ndarray:
+    jitter = np.random.default_rng(seed).standard_normal(vector.shape[0]).astype(np.float32)
+    return vector + noise * jitter
+
+
+def make_cache(**kwargs) -> SemanticCache:
+    options = {"threshold": 0.95, "ttl_seconds": 60, "max_entries": 100}
+    options.update(kwargs)
+    return SemanticCache(**options)
+
+
+def test_similar_query_hits():
+    cache = make_cache()
+    query = unit(1)
+    cache.put("docs", query, None, 10, {"results": ["a"]})
+
+    assert cache.get("docs", nearby(query, 2), None, 10) == {"results": ["a"]}
+    assert cache.get("docs", unit(3), None, 10) is None
+
+
+def test_constraints_are_part_of_the_key():
+    cache = make_cache()
+    query = unit(1)
+    cache.put("docs", query, {"category": "ai"}, 10, {"results": ["a"]})
+
+    assert cache.get("docs", query, {"category": "ai"}, 10) is not None
+    assert cache.get("docs", query, {"category": "web"}, 10) is None
+    assert cache.get("docs", query, {"category": "ai"}, 5) is None
+    assert cache.get("other", query, {"category": "ai"}, 10) is None
+
+
+def test_threshold_override():
+    cache = make_cache(threshold=0.5)
+    query = unit(1)
+    cache.put("docs", query, None, 10, {"results": ["a"]})
+    loose = nearby(query, 2, noise=0.2)
+
+    assert cache.get("docs", loose, None, 10) is not None
+    assert cache.get("docs", loose, None, 10, threshold=0.9999) is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = make_cache(ttl_seconds=30)
+    query = unit(1)
+    cache.put("docs", query, None, 10, {"results": ["a"]})
+
+    clock.now += 29
+    assert cache.get("docs", query, None, 10) is not None
+    clock.now += 2
+    assert cache.get("docs", query, None, 10) is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = make_cache(max_entries=2)
+    first, second, third = unit(1), unit(2), unit(3)
+    cache.put("docs", first, None, 10, {"results": ["first"]})
+    clock.now += 1
+    cache.put("docs", second, None, 10, {"results": ["second"]})
+    clock.now += 1
+    assert cache.get("docs", first, None, 10) is not None
+
+    clock.now += 1
+    cache.put("docs", third, None, 10, {"results": ["third"]})
+
+    assert cache.get("docs", first, None, 10) is not None
+    assert cache.get("docs", second, None, 10) is None
+    assert cache.get("docs", third, None, 10) is not None
+
+
+def test_invalidate_drops_collection_entries():
+    cache = make_cache()
+    query = unit(1)
+    cache.put("docs", query, None, 10, {"results": ["a"]})
+    cache.put("other", query, None, 10, {"results": ["b"]})
+
+    cache.invalidate("docs")
+    assert cache.get("docs", query, None, 10) is None
+    assert cache.get("other", query, None, 10) is not None
+
+    cache.invalidate()
+    assert cache.get("other", query, None, 10) is None
+
+
+def test_put_skips_responses_raced_by_a_write():
+    cache = make_cache()
+    query = unit(1)
+    generation = cache.generation("docs")
+    cache.invalidate("docs")
+
+    cache.put("docs", query, None, 10, {"results": ["stale"]}, generation)
+    assert cache.get("docs", query, None, 10) is None
+
+    cache.put("docs", query, None, 10, {"results": ["fresh"]}, cache.generation("docs"))
+    assert cache.get("docs", query, None, 10) == {"results": ["fresh"]}
+
+
+def test_int8_entries_still_hit():
+    cache = make_cache(int8=True)
+    query = unit(1)
+    cache.put("docs", query, None, 10, {"results": ["a"]})
+
+    bucket = next(iter(cache._buckets.values()))
+    assert bucket.vectors.dtype == np.int8
+    assert cache.get("docs", nearby(query, 2), None, 10) == {"results": ["a"]}
+    assert cache.get("docs", unit(3), None, 10) is None
+
+
+def test_pca_projection_keeps_near_duplicates_hitting():
+    cache = make_cache(pca_components=8, pca_fit_samples=20)
+    queries = [unit(seed) for seed in range(20)]
+    for index, query in enumerate(queries):
+        cache.put("docs", query, None, 10, {"results": [index]})
+
+    # Fitted inline (no running loop); earlier entries were re-encoded
+    bucket = next(iter(cache._buckets.values()))
+    assert cache._pca_basis is not None
+    assert bucket.vectors.shape == (20, 8)
+    norms = np.linalg.norm(bucket.vectors, axis=1)
+    assert np.allclose(norms, 1.0, atol=1e-5)
+
+    assert cache.get("docs", queries[7], None, 10) == {"results": [7]}
+
+
+def test_pca_fit_runs_in_executor_from_the_event_loop():
+    cache = make_cache(pca_components=8, pca_fit_samples=20)
+
+    async def fill() -> None:
+        for seed in range(20):
+            cache.put("docs", unit(seed), None, 10, {"results": [seed]})
+        assert cache._pca_fitting
+        while cache._pca_fitting:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(fill())
+
+    assert cache._pca_basis is not None
+    assert cache.get("docs", unit(3), None, 10) == {"results": [3]}
@@ -15,6 +15,8 @@ class Settings(BaseSettings):
         alias="DATABASE_URL",
     )
     qdrant_url: str = Field(default="http://qdrant:6333", alias="QDRANT_URL")
+    # Keep an int8 copy of vectors in new collections for faster (rescored) search
+    qdrant_scalar_quantization: bool = Field(default=False, alias="QDRANT_SCALAR_QUANTIZATION")
 
     minio_endpoint: str = Field(default="minio:9000", alias="MINIO_ENDPOINT")
     minio_access_key: str = Field(default="cortex", alias="MINIO_ACCESS_KEY")
@@ -29,6 +31,17 @@ class Settings(BaseSettings):
         default="models/gemini-1.5-flash", alias="GEMINI_VISION_MODEL"
     )
 
+    # Reuse search responses for near-identical queries (opt-in)
+    semantic_cache_enabled: bool = Field(default=False, alias="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(default=0.85, alias="SEMANTIC_CACHE_THRESHOLD")
+    semantic_cache_ttl_seconds: int = Field(default=300, alias="SEMANTIC_CACHE_TTL_SECONDS")
+    semantic_cache_max_entries: int = Field(default=1024, alias="SEMANTIC_CACHE_MAX_ENTRIES")
+    # 0 disables PCA; e.g. 256 stores cached query embeddings in 256 dimensions
+    semantic_cache_pca_components: int = Field(default=0, alias="SEMANTIC_CACHE_PCA_COMPONENTS")
+    semantic_cache_pca_fit_samples: int = Field(default=1000, alias="SEMANTIC_CACHE_PCA_FIT_SAMPLES")
+    # Store cached query embeddings as int8 (4x smaller than float32)
+    semantic_cache_int8: bool = Field(default=False, alias="SEMANTIC_CACHE_INT8")
+
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
     model_config = {
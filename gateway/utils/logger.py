@@ -1,46 +1,124 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements
+    orjson = None  # type: ignore[assignment]
+
 from .config import get_settings
 
 _LOGGER_CACHE: dict[str, logging.Logger] = {}
 
+# Extra values of these types are passed through as-is; anything else is
+# repr'd so both serializer backends render it the same way
+_JSON_NATIVE_TYPES = (str, int, float, bool, type(None), list, dict, tuple)
+
+# Fields to exclude to avoid conflicts with the keys set by JsonFormatter
+_EXCLUDED = frozenset({
+    "msg", "args", "levelname", "levelno", "name",
+    "message", "level", "time", "logger", "exc_info",
+    "exc_text", "stack_info",
+})
+
+# Everything a plain LogRecord carries; whatever is left over came from ``extra``
+_STANDARD_LOGRECORD_ATTRS = frozenset(vars(logging.makeLogRecord({})).keys()) | _EXCLUDED
+
+
+def _dumps(log_entry: dict[str, Any]) -> str:
+    """Serialize a log entry, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(
+            log_entry, default=repr, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(log_entry, ensure_ascii=False, default=repr)
+
 
 class JsonFormatter(logging.Formatter):
     """Format log records as single-line JSON objects."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (second, prefix) of the last timestamp, reused within that second. One
+        # tuple so concurrent producer threads read and replace it atomically
+        self._last: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return an ISO-8601 UTC timestamp, caching the per-second prefix."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        last_sec, prefix = self._last
+        if sec != last_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._last = (sec, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
+        # Fields passed via ``extra=``; nested oddities inside containers are
+        # handled by ``default=repr`` at dump time
+        record_dict = record.__dict__
+        extras = {
+            key: value if isinstance(value, _JSON_NATIVE_TYPES) else repr(value)
+            for key in record_dict.keys() - _STANDARD_LOGRECORD_ATTRS
+            for value in (record_dict[key],)
+        }
+
         log_entry: dict[str, Any] = {
             "level": record.levelname,
-            "message": record.getMessage(),
+            # Skip the %-formatting in getMessage() when there is nothing to interpolate
+            "message": record.getMessage() if record.args else str(record.msg),
             "logger": record.name,
             "time": self.formatTime(record, self.datefmt),
+            **extras,
         }
 
         if record.exc_info:
             log_entry["exc_info"] = self.formatException(record.exc_info)
 
-        # Fields to exclude to avoid conflicts
-        excluded_fields = {
-            "msg", "args", "levelname", "levelno", "name",
-            "message", "level", "time", "logger", "exc_info",
-            "exc_text", "stack_info"  # These are handled above
-        }
-        
-        for key, value in record.__dict__.items():
-            if key.startswith("_") or key in log_entry or key in excluded_fields:
-                continue
-            try:
-                json.dumps(value)
-                log_entry[key] = value
-            except TypeError:
-                log_entry[key] = repr(value)
+        return _dumps(log_entry)
+
+
+class _JsonQueueHandler(QueueHandler):
+    """Format records in the calling thread and enqueue the encoded line.
+
+    ``handle`` skips the per-handler lock: ``SimpleQueue.put_nowait`` is
+    already thread-safe, so producers never serialize on each other.
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return bool(rv)
 
-        return json.dumps(log_entry, ensure_ascii=False)
+    def prepare(self, record: logging.LogRecord) -> bytes:  # type: ignore[override]
+        return (self.format(record) + "\n").encode("utf-8")
+
+
+class _StdoutQueueListener(QueueListener):
+    """Single consumer thread that writes pre-formatted lines to stdout."""
+
+    def __init__(self, log_queue: queue.SimpleQueue[bytes]) -> None:
+        super().__init__(log_queue)  # type: ignore[arg-type]
+        self._stream = getattr(sys.stdout, "buffer", None)
+
+    def handle(self, line: bytes) -> None:  # type: ignore[override]
+        if self._stream is not None:
+            self._stream.write(line)
+        else:
+            sys.stdout.write(line.decode("utf-8"))
+        # Only flush once the queue is drained so bursts go out in one write
+        if self.queue.empty():
+            sys.stdout.flush()
 
 
 def configure_root_logger() -> None:
@@ -49,9 +127,14 @@ def configure_root_logger() -> None:
         return
 
     settings = get_settings()
-    handler = logging.StreamHandler(sys.stdout)
+    log_queue: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+    handler = _JsonQueueHandler(log_queue)  # type: ignore[arg-type]
     handler.setFormatter(JsonFormatter())
 
+    listener = _StdoutQueueListener(log_queue)
+    listener.start()
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         handlers=[handler],
         level=settings.log_level.upper(),
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def negotiate(request: Request, content: Any) -> Any:
+    """Encode content as msgpack when the client accepts it, else return it for JSON encoding.
+
+    Numbers are packed as binary instead of decimal text, which keeps score- and
+    chunk-heavy responses smaller and faster to decode.
+    """
+    if MSGPACK_MEDIA_TYPE not in request.headers.get("accept", ""):
+        return content
+    return Response(
+        content=msgpack.packb(jsonable_encoder(content)),
+        media_type=MSGPACK_MEDIA_TYPE,
+    )
@@ -16,10 +16,11 @@ import asyncio
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import httpx
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
-from cortexdb import CortexClient, FieldDefinition, FieldType
+from cortexdb import CortexClient, CortexDBNotFoundError, FieldDefinition, FieldType
 
 
 # Models
@@ -50,14 +51,18 @@ async def lifespan(app: FastAPI):
 
     # Startup
     print("Starting CortexDB client...")
-    cortex = CortexClient("http://localhost:8000")
+    # Pool sized so concurrent endpoint calls don't queue for a connection
+    cortex = CortexClient(
+        "http://localhost:8000",
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
     await cortex.__aenter__()
 
     # Criar collection se não existir
     try:
         await cortex.collections.get(COLLECTION)
         print(f"Collection '{COLLECTION}' já existe")
-    except:
+    except CortexDBNotFoundError:
         print(f"Criando collection '{COLLECTION}'...")
         await cortex.collections.create(
             name=COLLECTION,
@@ -17,8 +17,7 @@ c.setFont("Helvetica", 12)
 c.drawString(2*inch, 9*inch, "Este é um documento de teste para Docling.")
 c.drawString(2*inch, 8.5*inch, "O Docling processa documentos de forma avançada:")
 
-# Lista
-y = 7.5*inch
+# Lista (um único text object para todas as linhas)
 items = [
     "- Layout understanding",
     "- Tabelas estruturadas",
@@ -26,9 +25,12 @@ items = [
     "- OCR integrado"
 ]
 
+t = c.beginText(2*inch, 7.5*inch)
+t.setFont("Helvetica", 12)
+t.setLeading(0.3*inch)
 for item in items:
-    c.drawString(2*inch, y, item)
-    y -= 0.3*inch
+    t.textLine(item)
+c.drawText(t)
 
 # Tabela
 c.setFont("Helvetica-Bold", 12)
@@ -40,8 +42,12 @@ y = 5*inch
 headers = ["Item", "Valor", "Status"]
 x_positions = [2*inch, 3.5*inch, 5*inch]
 
+t = c.beginText()
+t.setFont("Helvetica", 10)
 for i, header in enumerate(headers):
-    c.drawString(x_positions[i], y, header)
+    t.setTextOrigin(x_positions[i], y)
+    t.textOut(header)
+c.drawText(t)
 
 y -= 0.3*inch
 
@@ -56,10 +62,14 @@ data = [
     ["C", "300", "Pendente"]
 ]
 
+t = c.beginText()
+t.setFont("Helvetica", 10)
 for row in data:
     for i, cell in enumerate(row):
-        c.drawString(x_positions[i], y, cell)
+        t.setTextOrigin(x_positions[i], y)
+        t.textOut(cell)
     y -= 0.3*inch
+c.drawText(t)
 
 # Rodapé
 c.setFont("Helvetica", 10)
@@ -1,13 +1,273 @@
 """Helper functions for playground tests."""
 
+import asyncio
+import atexit
+import importlib.util
 import os
+import sys
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Coroutine, List, Optional, TypeVar
 
 import httpx
+from cortexdb import CortexClient
+from dotenv import dotenv_values
 
+BASE_URL = "http://localhost:8000"
+ENV_FILE = Path(__file__).parent.parent / ".env"
+# Seconds shared_cortex_client waits for background tasks (e.g. teardown) on exit
+BACKGROUND_TIMEOUT = 5.0
+# Upper bound for Pipeline windows; deeper queues per connection stop helping
+MAX_PIPELINE_DEPTH = 1024
 
-async def ensure_gemini_provider(base_url: str = "http://localhost:8000") -> str:
+T = TypeVar("T")
+
+# base_url -> provider ID resolved by ensure_gemini_provider
+_PROVIDER_CACHE: dict[str, str] = {}
+# base_url -> in-flight lookup, so concurrent first calls share one request
+_PROVIDER_PENDING: dict[str, "asyncio.Task[str]"] = {}
+
+# Shared clients so helper and script calls reuse pooled keep-alive connections.
+# Connections are bound to the loop that opened them (each asyncio.run() is a
+# new loop), so both are closed and recreated when the running loop changes.
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_CORTEX: Optional[CortexClient] = None
+_CORTEX_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+# Fire-and-forget tasks started with run_in_background
+_BACKGROUND: set["asyncio.Task[Any]"] = set()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it for the running event loop."""
+    global _CLIENT, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        if _CLIENT is not None and not _CLIENT.is_closed:
+            await _close_stale(_CLIENT.aclose())
+        _CLIENT = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+        _CLIENT_LOOP = loop
+    return _CLIENT
+
+
+async def get_cortex_client(base_url: str = BASE_URL) -> CortexClient:
+    """Return the shared CortexClient, creating it for the running event loop."""
+    global _CORTEX, _CORTEX_LOOP
+    loop = asyncio.get_running_loop()
+    if _CORTEX is None or _CORTEX_LOOP is not loop:
+        if _CORTEX is not None:
+            await _close_stale(_CORTEX.close())
+        _CORTEX = CortexClient(
+            base_url,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+            # HTTP/2 is only negotiated over TLS; plain http:// stays on HTTP/1.1
+            http2=base_url.startswith("https://") and importlib.util.find_spec("h2") is not None,
+            msgpack=importlib.util.find_spec("msgpack") is not None,
+        )
+        _CORTEX_LOOP = loop
+    return _CORTEX
+
+
+async def _close_stale(closing: Coroutine[Any, Any, Any]) -> None:
+    """Close a client left over from a previous loop; its connections may already be dead."""
+    try:
+        await closing
+    except Exception:
+        pass
+
+
+@asynccontextmanager
+async def shared_cortex_client(base_url: str = BASE_URL) -> AsyncIterator[CortexClient]:
+    """
+    Drop-in for ``async with CortexClient(...)`` that keeps the pool open on exit.
+
+    On exit, waits up to BACKGROUND_TIMEOUT seconds for tasks started with
+    run_in_background, cancelling any still running.
+    """
+    try:
+        yield await get_cortex_client(base_url)
+    finally:
+        await wait_background()
+
+
+def run_in_background(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """Start a coroutine without awaiting it; failures are reported when it ends."""
+    task = asyncio.create_task(coro)
+    _BACKGROUND.add(task)
+    task.add_done_callback(_finish_background)
+    return task
+
+
+def _finish_background(task: "asyncio.Task[Any]") -> None:
+    _BACKGROUND.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"   ⚠️  Background task failed: {task.exception()}")
+
+
+async def wait_background(timeout: float = BACKGROUND_TIMEOUT) -> None:
+    """Give pending background tasks up to ``timeout`` seconds, then cancel the rest."""
+    if not _BACKGROUND:
+        return
+    _, pending = await asyncio.wait(set(_BACKGROUND), timeout=timeout)
+    for task in pending:
+        task.cancel()
+
+
+async def close_client() -> None:
+    """Close the shared clients used by the helpers and scripts."""
+    global _CLIENT, _CLIENT_LOOP, _CORTEX, _CORTEX_LOOP
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    if _CORTEX is not None:
+        await _CORTEX.close()
+    _CLIENT = None
+    _CLIENT_LOOP = None
+    _CORTEX = None
+    _CORTEX_LOOP = None
+
+
+def _close_client_at_exit() -> None:
+    if _CLIENT is None and _CORTEX is None:
+        return
+    try:
+        asyncio.run(close_client())
+    except Exception:
+        pass
+
+
+atexit.register(_close_client_at_exit)
+
+
+def run_main(main: Coroutine[Any, Any, T]) -> T:
+    """Run a script entrypoint on uvloop when it is installed, else on the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
+class Pipeline:
+    """
+    Issue independent requests together with a bounded number in flight.
+
+    Example:
+        pipeline = Pipeline(max_concurrent=4)
+        pipeline.add(client.collections.get("docs"))
+        pipeline.add(client.records.get_vectors("docs", record_id))
+        schema, vectors = await pipeline.results()
+    """
+
+    def __init__(self, max_concurrent: int = 4) -> None:
+        if not 1 <= max_concurrent <= MAX_PIPELINE_DEPTH:
+            raise ValueError(f"max_concurrent must be between 1 and {MAX_PIPELINE_DEPTH}")
+        self.max_concurrent = max_concurrent
+        self._pending: List[Coroutine[Any, Any, Any]] = []
+
+    def add(self, coro: Coroutine[Any, Any, Any]) -> int:
+        """Queue a request and return its index in ``results()``."""
+        self._pending.append(coro)
+        return len(self._pending) - 1
+
+    async def results(self, return_exceptions: bool = False) -> List[Any]:
+        """
+        Run the queued requests and return their results in the order they were added.
+
+        With ``return_exceptions``, a failed request's exception takes its place in
+        the results and the others still complete. Otherwise the requests run in an
+        ``asyncio.TaskGroup`` (Python 3.11+, an ``asyncio.wait`` equivalent on older
+        versions): a failure cancels the requests still running and is raised as-is,
+        not wrapped in an ExceptionGroup, so callers handle it the same way everywhere.
+        """
+        pending, self._pending = self._pending, []
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def run(coro: Coroutine[Any, Any, Any]) -> Any:
+            async with semaphore:
+                if not return_exceptions:
+                    return await coro
+                try:
+                    return await coro
+                except Exception as exc:
+                    return exc
+
+        if hasattr(asyncio, "TaskGroup"):
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [group.create_task(run(coro)) for coro in pending]
+            except BaseExceptionGroup as errors:  # noqa: F821 - builtin on 3.11+
+                raise errors.exceptions[0] from None
+            return [task.result() for task in tasks]
+
+        # Before 3.11: same semantics with asyncio.wait
+        tasks = [asyncio.ensure_future(run(coro)) for coro in pending]
+        if not tasks:
+            return []
+        try:
+            done, running = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except BaseException:
+            running = set(tasks)
+            raise
+        finally:
+            # Only non-empty after a failure (or our own cancellation)
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        for task in tasks:
+            if task in done and task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
+
+
+@asynccontextmanager
+async def progress_log() -> AsyncIterator[Callable[..., None]]:
+    """
+    Yield a ``print``-like function whose output is written by a background task.
+
+    Messages are queued without blocking, so stdout writes stay off the path between
+    a request completing and the next one starting. Everything queued is written
+    before the context exits.
+    """
+    queue: asyncio.Queue[str] = asyncio.Queue()
+
+    async def drain() -> None:
+        while True:
+            lines = [await queue.get()]
+            while not queue.empty():
+                lines.append(queue.get_nowait())
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+            for _ in lines:
+                queue.task_done()
+
+    def log(message: str = "") -> None:
+        queue.put_nowait(f"{message}\n")
+
+    writer = asyncio.create_task(drain())
+    try:
+        yield log
+    finally:
+        await queue.join()
+        writer.cancel()
+
+
+@lru_cache(maxsize=1)
+def _gemini_api_key() -> Optional[str]:
+    """Resolve GEMINI_API_KEY from the environment or the project .env (parsed once)."""
+    return os.getenv("GEMINI_API_KEY") or dotenv_values(ENV_FILE).get("GEMINI_API_KEY")
+
+
+async def ensure_gemini_provider(base_url: str = BASE_URL) -> str:
     """
     Ensure a Gemini embedding provider is configured.
     
@@ -22,19 +282,20 @@ async def ensure_gemini_provider(base_url: str = "http://localhost:8000") -> str
     Raises:
         ValueError: If GEMINI_API_KEY is not found in .env
     """
-    # Try to read GEMINI_API_KEY from .env
-    api_key = os.getenv("GEMINI_API_KEY")
-    
-    if not api_key:
-        # Try to load from .env file
-        env_file = Path(__file__).parent.parent / ".env"
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("GEMINI_API_KEY="):
-                        api_key = line.split("=", 1)[1].strip().strip('"').strip("'")
-                        break
+    if base_url in _PROVIDER_CACHE:
+        return _PROVIDER_CACHE[base_url]
+
+    pending = _PROVIDER_PENDING.get(base_url)
+    if pending is None:
+        pending = asyncio.create_task(_resolve_gemini_provider(base_url))
+        _PROVIDER_PENDING[base_url] = pending
+        pending.add_done_callback(lambda _: _PROVIDER_PENDING.pop(base_url, None))
+    return await pending
+
+
+async def _resolve_gemini_provider(base_url: str) -> str:
+    """Look up or create the test provider and record it in the cache."""
+    api_key = _gemini_api_key()
     
     if not api_key:
         raise ValueError(
@@ -43,58 +304,62 @@ async def ensure_gemini_provider(base_url: str = "http://localhost:8000") -> str
         )
     
     # Check if provider already exists
-    async with httpx.AsyncClient() as client:
-        # List existing providers
-        try:
-            response = await client.get(f"{base_url}/providers/embeddings")
-            response.raise_for_status()
-            providers = response.json()
-            
-            # Look for a gemini provider named "test-gemini"
-            for provider in providers:
-                if provider.get("name") == "test-gemini" and provider.get("enabled"):
-                    print(f"   ℹ️  Using existing provider: {provider['id']}")
-                    return provider["id"]
-        except Exception:
-            pass
-        
-        # Create new provider
-        print("   ℹ️  Creating new Gemini embedding provider...")
-        response = await client.post(
-            f"{base_url}/providers/embeddings",
-            json={
-                "name": "test-gemini",
-                "provider": "gemini",
-                "api_key": api_key,
-                "embedding_model": "models/embedding-001",
-            }
-        )
+    client = await _get_client()
+
+    # List existing providers
+    try:
+        response = await client.get(f"{base_url}/providers/embeddings")
         response.raise_for_status()
-        provider_data = response.json()
-        provider_id = provider_data["id"]
-        print(f"   ✅ Provider created: {provider_id}")
-        return provider_id
+        providers = response.json()
+        
+        # Look for a gemini provider named "test-gemini"
+        for provider in providers:
+            if provider.get("name") == "test-gemini" and provider.get("enabled"):
+                print(f"   ℹ️  Using existing provider: {provider['id']}")
+                _PROVIDER_CACHE[base_url] = provider["id"]
+                return provider["id"]
+    except Exception:
+        pass
+    
+    # Create new provider
+    print("   ℹ️  Creating new Gemini embedding provider...")
+    response = await client.post(
+        f"{base_url}/providers/embeddings",
+        json={
+            "name": "test-gemini",
+            "provider": "gemini",
+            "api_key": api_key,
+            "embedding_model": "models/embedding-001",
+        }
+    )
+    response.raise_for_status()
+    provider_data = response.json()
+    provider_id = provider_data["id"]
+    print(f"   ✅ Provider created: {provider_id}")
+    _PROVIDER_CACHE[base_url] = provider_id
+    return provider_id
 
 
-async def cleanup_test_provider(base_url: str = "http://localhost:8000") -> None:
+async def cleanup_test_provider(base_url: str = BASE_URL) -> None:
     """
     Clean up test provider created by ensure_gemini_provider.
     
     Args:
         base_url: Base URL of the CortexDB gateway
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{base_url}/providers/embeddings")
-            response.raise_for_status()
-            providers = response.json()
-            
-            for provider in providers:
-                if provider.get("name") == "test-gemini":
-                    await client.delete(
-                        f"{base_url}/providers/embeddings/{provider['id']}"
-                    )
-                    print(f"   ℹ️  Deleted test provider: {provider['id']}")
-        except Exception as e:
-            print(f"   ⚠️  Could not cleanup provider: {e}")
+    _PROVIDER_CACHE.pop(base_url, None)
+    client = await _get_client()
+    try:
+        response = await client.get(f"{base_url}/providers/embeddings")
+        response.raise_for_status()
+        providers = response.json()
+        
+        for provider in providers:
+            if provider.get("name") == "test-gemini":
+                await client.delete(
+                    f"{base_url}/providers/embeddings/{provider['id']}"
+                )
+                print(f"   ℹ️  Deleted test provider: {provider['id']}")
+    except Exception as e:
+        print(f"   ⚠️  Could not cleanup provider: {e}")
 
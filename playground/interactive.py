@@ -12,7 +12,7 @@ Depois você pode usar diretamente no terminal:
 
 import asyncio
 
-from cortexdb import CortexClient, FieldDefinition, FieldType
+from cortexdb import CortexClient, CortexDBNotFoundError, FieldDefinition, FieldType
 
 # Global client
 client = None
@@ -36,7 +36,7 @@ async def create_collection():
     try:
         await client.collections.delete(COLLECTION)
         print(f"(deletou collection antiga)")
-    except:
+    except CortexDBNotFoundError:
         pass
 
     schema = await client.collections.create(
@@ -73,11 +73,10 @@ async def create_sample_data():
         },
     ]
 
-    records = []
-    for doc in docs:
-        record = await client.records.create(collection=COLLECTION, data=doc)
-        records.append(record)
-        print(f"✓ Created: {doc['title']}")
+    records = await asyncio.gather(
+        *(client.records.create(collection=COLLECTION, data=doc) for doc in docs)
+    )
+    print("\n".join(f"✓ Created: {doc['title']}" for doc in docs))
 
     return records
 
@@ -87,9 +86,11 @@ async def search(query: str, limit: int = 5):
     await init()
     results = await client.records.query(collection=COLLECTION, query=query, limit=limit)
 
-    print(f"\nResultados para '{query}':")
-    for i, r in enumerate(results, 1):
-        print(f"{i}. {r.data['title']} (score: {r.score:.4f})")
+    lines = [f"\nResultados para '{query}':"]
+    lines.extend(
+        f"{i}. {r.data['title']} (score: {r.score:.4f})" for i, r in enumerate(results, 1)
+    )
+    print("\n".join(lines))
 
     return results
 
@@ -101,7 +102,7 @@ async def cleanup():
         try:
             await client.collections.delete(COLLECTION)
             print(f"✓ Collection '{COLLECTION}' deletada")
-        except:
+        except CortexDBNotFoundError:
             pass
         await client.__aexit__(None, None, None)
         client = None
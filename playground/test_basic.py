@@ -16,13 +16,7 @@ async def main():
 
         # 2. Criar collection
         print("2. Criando collection 'playground_test'...")
-        try:
-            await client.collections.delete("playground_test")
-            print("   (deletou collection antiga)")
-        except:
-            pass
-
-        schema = await client.collections.create(
+        schema = await client.collections.create_or_replace(
             name="playground_test",
             fields=[
                 FieldDefinition(name="title", type=FieldType.STRING),
@@ -37,20 +31,22 @@ async def main():
 
         # 3. Criar records
         print("3. Criando records...")
-        records = []
-        for i in range(5):
-            record = await client.records.create(
-                collection="playground_test",
-                data={
-                    "title": f"Produto {i+1}",
-                    "description": f"Descrição do produto {i+1}",
-                    "price": 10.99 * (i + 1),
-                    "stock": 100 - (i * 10),
-                    "active": i % 2 == 0,
-                },
+        records = await asyncio.gather(
+            *(
+                client.records.create(
+                    collection="playground_test",
+                    data={
+                        "title": f"Produto {i+1}",
+                        "description": f"Descrição do produto {i+1}",
+                        "price": 10.99 * (i + 1),
+                        "stock": 100 - (i * 10),
+                        "active": i % 2 == 0,
+                    },
+                )
+                for i in range(5)
             )
-            records.append(record)
-            print(f"   Record {i+1}: {record.id}")
+        )
+        print("\n".join(f"   Record {i+1}: {record.id}" for i, record in enumerate(records)))
         print()
 
         # 4. Ler record
@@ -78,9 +74,9 @@ async def main():
         # 7. Listar collections
         print("7. Listando collections...")
         collections = await client.collections.list()
-        print(f"   Total: {len(collections)}")
-        for col in collections:
-            print(f"   - {col.name}")
+        lines = [f"   Total: {len(collections)}"]
+        lines.extend(f"   - {col.name}" for col in collections)
+        print("\n".join(lines))
         print()
 
         # Cleanup
@@ -1,11 +1,20 @@
 """Test de processamento de documentos com Docling (PDF, DOCX, XLSX)."""
 
-import asyncio
 from pathlib import Path
 
 from cortexdb import CortexClient, FieldDefinition, FieldType
 
-from helpers import ensure_gemini_provider
+from helpers import ensure_gemini_provider, run_main
+
+DOCLING_TEST_FIELDS = (
+    FieldDefinition(name="title", type=FieldType.STRING),
+    FieldDefinition(name="doc_type", type=FieldType.STRING),
+    FieldDefinition(
+        name="document", 
+        type=FieldType.FILE, 
+        vectorize=True  # Docling vai processar e vetorizar
+    ),
+)
 
 
 async def main():
@@ -23,22 +32,9 @@ async def main():
 
         # 1. Criar collection para documentos
         print("1. Criando collection para documentos...")
-        try:
-            await client.collections.delete("docling_test")
-        except:
-            pass
-
-        schema = await client.collections.create(
+        schema = await client.collections.create_or_replace(
             name="docling_test",
-            fields=[
-                FieldDefinition(name="title", type=FieldType.STRING),
-                FieldDefinition(name="doc_type", type=FieldType.STRING),
-                FieldDefinition(
-                    name="document", 
-                    type=FieldType.FILE, 
-                    vectorize=True  # Docling vai processar e vetorizar
-                ),
-            ],
+            fields=list(DOCLING_TEST_FIELDS),
             embedding_provider=provider_id,
         )
         print(f"   ✅ Collection: {schema.name}\n")
@@ -148,7 +144,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main(main())
     except Exception as e:
         print(f"\n❌ Erro: {e}")
         print("\nNOTA: Este teste requer GEMINI_API_KEY e gateway rodando")
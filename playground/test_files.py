@@ -12,12 +12,7 @@ async def main():
     async with CortexClient("http://localhost:8000") as client:
         # 1. Criar collection com file field
         print("1. Criando collection com file field...")
-        try:
-            await client.collections.delete("playground_files")
-        except:
-            pass
-
-        schema = await client.collections.create(
+        schema = await client.collections.create_or_replace(
             name="playground_files",
             fields=[
                 FieldDefinition(name="title", type=FieldType.STRING),
@@ -1,16 +1,23 @@
 """Test de filtros avançados na busca."""
 
-import asyncio
+from cortexdb import FieldDefinition, FieldType
 
-from cortexdb import CortexClient, FieldDefinition, FieldType
+from helpers import ensure_gemini_provider, run_main, shared_cortex_client
 
-from helpers import ensure_gemini_provider
+PLAYGROUND_FILTERS_FIELDS = (
+    FieldDefinition(name="title", type=FieldType.STRING),
+    FieldDefinition(name="content", type=FieldType.TEXT, vectorize=True),
+    FieldDefinition(name="year", type=FieldType.INT),
+    FieldDefinition(name="price", type=FieldType.FLOAT),
+    FieldDefinition(name="available", type=FieldType.BOOLEAN),
+    FieldDefinition(name="category", type=FieldType.STRING),
+)
 
 
 async def main():
     print("=== Teste de Filtros Avançados ===\n")
 
-    async with CortexClient("http://localhost:8000") as client:
+    async with shared_cortex_client() as client:
         # 0. Configurar embedding provider
         print("0. Configurando embedding provider...")
         try:
@@ -22,21 +29,9 @@ async def main():
 
         # 1. Criar collection
         print("1. Criando collection...")
-        try:
-            await client.collections.delete("playground_filters")
-        except:
-            pass
-
-        schema = await client.collections.create(
+        schema = await client.collections.create_or_replace(
             name="playground_filters",
-            fields=[
-                FieldDefinition(name="title", type=FieldType.STRING),
-                FieldDefinition(name="content", type=FieldType.TEXT, vectorize=True),
-                FieldDefinition(name="year", type=FieldType.INT),
-                FieldDefinition(name="price", type=FieldType.FLOAT),
-                FieldDefinition(name="available", type=FieldType.BOOLEAN),
-                FieldDefinition(name="category", type=FieldType.STRING),
-            ],
+            fields=list(PLAYGROUND_FILTERS_FIELDS),
             embedding_provider=provider_id,
         )
         print(f"   Collection: {schema.name}\n")
@@ -86,8 +81,8 @@ async def main():
             },
         ]
 
+        await client.records.bulk_create(collection="playground_filters", data=data)
         for item in data:
-            await client.records.create(collection="playground_filters", data=item)
             print(f"   - {item['title']}")
         print()
 
@@ -162,7 +157,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main(main())
     except Exception as e:
         print(f"\n❌ Erro: {e}")
         print("\nNOTA: Filtros requerem embedding provider para busca semântica!")
@@ -3,9 +3,19 @@
 import asyncio
 from pathlib import Path
 
-from cortexdb import CortexClient, FieldDefinition, FieldType
+from cortexdb import FieldDefinition, FieldType
 
-from helpers import ensure_gemini_provider
+from helpers import ensure_gemini_provider, run_main, shared_cortex_client
+
+PDF_IMAGES_TEST_FIELDS = (
+    FieldDefinition(name="filename", type=FieldType.STRING),
+    FieldDefinition(name="doc_type", type=FieldType.STRING),
+    FieldDefinition(
+        name="document",
+        type=FieldType.FILE,
+        vectorize=True  # Docling vai processar imagens e texto
+    ),
+)
 
 
 async def test_pdf_processing():
@@ -25,7 +35,7 @@ async def test_pdf_processing():
     print(f"   Tamanho: {pdf_path.stat().st_size / 1024:.1f} KB")
     print()
     
-    async with CortexClient("http://localhost:8000") as client:
+    async with shared_cortex_client() as client:
         # Configurar provider
         print("1. Configurando embedding provider...")
         try:
@@ -37,22 +47,9 @@ async def test_pdf_processing():
         
         # Criar collection
         print("2. Criando collection...")
-        try:
-            await client.collections.delete("pdf_images_test")
-        except:
-            pass
-        
-        schema = await client.collections.create(
+        schema = await client.collections.create_or_replace(
             name="pdf_images_test",
-            fields=[
-                FieldDefinition(name="filename", type=FieldType.STRING),
-                FieldDefinition(name="doc_type", type=FieldType.STRING),
-                FieldDefinition(
-                    name="document",
-                    type=FieldType.FILE,
-                    vectorize=True  # Docling vai processar imagens e texto
-                ),
-            ],
+            fields=list(PDF_IMAGES_TEST_FIELDS),
             embedding_provider=provider_id,
         )
         print(f"   ✅ Collection: {schema.name}\n")
@@ -87,25 +84,27 @@ async def test_pdf_processing():
                 print("   📝 Preview dos chunks (primeiros 5):")
                 print("   " + "-" * 66)
                 for i, chunk in enumerate(vectors[:5], 1):
-                    # Limpa o texto para display
-                    text = chunk.text.replace('\n', ' ').strip()
-                    preview = text[:120] if len(text) > 120 else text
+                    # Limpa só o trecho exibido, não o chunk inteiro
+                    raw = chunk.text
+                    total_len = len(raw)
+                    preview = raw[:160].replace('\n', ' ').strip()[:120]
                     
                     print(f"   Chunk {i}:")
                     print(f"   └─ {preview}")
-                    if len(text) > 120:
-                        print(f"      ... (+{len(text) - 120} chars)")
+                    if total_len > 120:
+                        print(f"      ... (+{total_len - 120} chars)")
                     print()
                 
                 # Estatísticas
-                total_chars = sum(len(c.text) for c in vectors)
-                avg_chunk_size = total_chars // len(vectors) if vectors else 0
+                lengths = [len(c.text) for c in vectors]
+                total_chars = sum(lengths)
+                avg_chunk_size = total_chars // len(lengths)
                 
                 print("   📊 Estatísticas:")
                 print(f"   ├─ Chunks gerados: {len(vectors)}")
                 print(f"   ├─ Total de caracteres: {total_chars:,}")
                 print(f"   ├─ Tamanho médio/chunk: {avg_chunk_size}")
-                print(f"   └─ Maior chunk: {max(len(c.text) for c in vectors)} chars")
+                print(f"   └─ Maior chunk: {max(lengths)} chars")
                 print()
         except Exception as e:
             print(f"   ⚠️  Erro ao obter vectors: {e}\n")
@@ -118,24 +117,34 @@ async def test_pdf_processing():
             "número de pedido",
         ]
         
-        for query in queries:
-            try:
-                response = await client._http.post(
+        # Dispara todas as buscas em paralelo; erros ficam por query
+        responses = await asyncio.gather(
+            *(
+                client._http.post(
                     f"/collections/pdf_images_test/search",
                     json={"query": query, "limit": 2}
                 )
-                results = response.get("results", [])
-                
-                if results:
-                    print(f"   🔍 Query: '{query}'")
-                    print(f"   └─ Score: {results[0]['score']:.4f}")
-                    highlight = results[0].get('highlights', [])
-                    if highlight:
-                        text = highlight[0]['text'][:80].replace('\n', ' ')
-                        print(f"      Match: {text}...")
-                    print()
-            except Exception as e:
-                print(f"   ⚠️  Busca falhou para '{query}': {e}")
+                for query in queries
+            ),
+            return_exceptions=True,
+        )
+
+        for query, response in zip(queries, responses):
+            if isinstance(response, Exception):
+                print(f"   ⚠️  Busca falhou para '{query}': {response}")
+                continue
+
+            results = response.get("results", [])
+            
+            if results:
+                top = results[0]
+                print(f"   🔍 Query: '{query}'")
+                print(f"   └─ Score: {top['score']:.4f}")
+                highlight = top.get('highlights', [])
+                if highlight:
+                    text = highlight[0]['text'][:80].replace('\n', ' ')
+                    print(f"      Match: {text}...")
+                print()
         
         # Informações sobre como Docling processou
         print("=" * 70)
@@ -193,7 +202,7 @@ async def test_pdf_processing():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(test_pdf_processing())
+        run_main(test_pdf_processing())
     except KeyboardInterrupt:
         print("\n\n⏸️  Teste interrompido pelo usuário")
     except Exception as e:
@@ -2,15 +2,25 @@
 
 import asyncio
 
-from cortexdb import CortexClient, FieldDefinition, FieldType
+from cortexdb import FieldDefinition, FieldType
 
-from helpers import ensure_gemini_provider
+from helpers import ensure_gemini_provider, run_main, shared_cortex_client
+
+KNOWLEDGE_BASE_FIELDS = (
+    FieldDefinition(name="title", type=FieldType.STRING),
+    FieldDefinition(
+        name="content", 
+        type=FieldType.TEXT, 
+        vectorize=True  # Vetoriza para busca semântica
+    ),
+    FieldDefinition(name="source", type=FieldType.STRING),
+)
 
 
 async def main():
     print("=== Teste de RAG - Retrieval Augmented Generation ===\n")
 
-    async with CortexClient("http://localhost:8000") as client:
+    async with shared_cortex_client() as client:
         # 0. Configurar embedding provider
         print("0. Configurando embedding provider...")
         try:
@@ -22,22 +32,9 @@ async def main():
 
         # 1. Criar knowledge base com documentos vetorizados
         print("1. Criando knowledge base...")
-        try:
-            await client.collections.delete("knowledge_base")
-        except:
-            pass
-
-        schema = await client.collections.create(
+        schema = await client.collections.create_or_replace(
             name="knowledge_base",
-            fields=[
-                FieldDefinition(name="title", type=FieldType.STRING),
-                FieldDefinition(
-                    name="content", 
-                    type=FieldType.TEXT, 
-                    vectorize=True  # Vetoriza para busca semântica
-                ),
-                FieldDefinition(name="source", type=FieldType.STRING),
-            ],
+            fields=list(KNOWLEDGE_BASE_FIELDS),
             embedding_provider=provider_id,
         )
         print(f"   ✅ Knowledge base criada: {schema.name}\n")
@@ -86,13 +83,36 @@ async def main():
             },
         ]
 
-        record_ids = []
-        for doc in documents:
-            record = await client.records.create(
-                collection="knowledge_base", 
-                data=doc
+        record_ids = await client.records.bulk_create(
+            collection="knowledge_base",
+            data=documents,
+        )
+
+        queries = [
+            "Como começar a programar?",
+            "Quais ferramentas usar para inteligência artificial?",
+            "Como criar uma API REST?",
+            "Qual banco de dados usar?",
+        ]
+
+        # bulk_create só retorna depois de indexar, então as leituras dos passos 3 e 4
+        # já podem sair enquanto o resultado da ingestão é impresso.
+        # Busca semântica vetorial - todas as perguntas em paralelo
+        # Usar o endpoint /search diretamente pois query() usa endpoint errado
+        search_tasks = [
+            asyncio.create_task(
+                client._http.post(
+                    f"/collections/knowledge_base/search",
+                    json={"query": query, "limit": 2}
+                )
             )
-            record_ids.append(record.id)
+            for query in queries
+        ]
+        vectors_task = asyncio.create_task(
+            client.records.get_vectors("knowledge_base", record_ids[0])
+        )
+
+        for doc in documents:
             print(f"   ✅ {doc['title']}")
         print(f"\n   Total: {len(record_ids)} documentos adicionados\n")
 
@@ -101,33 +121,24 @@ async def main():
         print("3. RAG - Busca Semântica Vetorial")
         print("=" * 60)
         
-        queries = [
-            "Como começar a programar?",
-            "Quais ferramentas usar para inteligência artificial?",
-            "Como criar uma API REST?",
-            "Qual banco de dados usar?",
-        ]
+        # As buscas já foram disparadas logo após a ingestão
+        responses = await asyncio.gather(*search_tasks)
 
-        for i, query in enumerate(queries, 1):
+        for i, (query, response) in enumerate(zip(queries, responses), 1):
             print(f"\n📝 Pergunta {i}: '{query}'")
             print("-" * 60)
             
-            # Busca semântica vetorial
-            # Usar o endpoint /search diretamente pois query() usa endpoint errado
-            response = await client._http.post(
-                f"/collections/knowledge_base/search",
-                json={"query": query, "limit": 2}
-            )
             results = response.get("results", [])
             
             if results:
                 print(f"✅ Encontrados {len(results)} resultados relevantes:\n")
                 for j, result in enumerate(results, 1):
                     record = result['record']
-                    print(f"   {j}. {record['title']} (score: {result['score']:.4f})")
-                    print(f"      Fonte: {record['source']}")
+                    title, source, content = record['title'], record['source'], record['content']
+                    print(f"   {j}. {title} (score: {result['score']:.4f})")
+                    print(f"      Fonte: {source}")
                     # Mostra preview do conteúdo
-                    content_preview = record['content'][:150].replace('\n', ' ')
+                    content_preview = content[:150].replace('\n', ' ')
                     print(f"      Preview: {content_preview}...")
                     print()
             else:
@@ -139,9 +150,8 @@ async def main():
         print("=" * 60)
         print()
         
-        # Pegar o primeiro documento
-        first_doc_id = record_ids[0]
-        vectors = await client.records.get_vectors("knowledge_base", first_doc_id)
+        # Vectors do primeiro documento (requisição disparada após a ingestão)
+        vectors = await vectors_task
         
         print(f"📄 Documento: {documents[0]['title']}")
         print(f"   Total de chunks vetorizados: {len(vectors)}")
@@ -164,17 +174,19 @@ async def main():
         print(f"📝 Pergunta: '{query}' (filtro: source contém 'ml')")
         print("-" * 60)
         
-        response = await client._http.post(
-            f"/collections/knowledge_base/search",
-            json={"query": query, "limit": 3, "filters": {"source": {"$like": "%ml%"}}}
-        )
-        results = response.get("results", [])
-        
-        print(f"✅ Resultados filtrados: {len(results)}\n")
-        for i, result in enumerate(results, 1):
-            record = result['record']
-            print(f"   {i}. {record['title']} (score: {result['score']:.4f})")
+        # Resultados chegam em streaming: o primeiro é impresso antes do último ser montado
+        total = 0
+        async for result in client.records.query_stream(
+            "knowledge_base",
+            query,
+            limit=3,
+            filters={"source": {"$like": "%ml%"}},
+        ):
+            total += 1
+            record = result.data
+            print(f"   {total}. {record['title']} (score: {result.score:.4f})")
             print(f"      Fonte: {record['source']}\n")
+        print(f"✅ Resultados filtrados: {total}\n")
 
         # 6. Comparação: busca vs filtro exato
         print("=" * 60)
@@ -182,12 +194,21 @@ async def main():
         print("=" * 60)
         print()
         
-        print("🔍 Busca semântica: 'bibliotecas para análise de dados'")
-        response = await client._http.post(
-            f"/collections/knowledge_base/search",
-            json={"query": "bibliotecas para análise de dados", "limit": 2}
+        # As duas buscas são independentes - disparadas em paralelo
+        semantic_response, exact_response = await asyncio.gather(
+            client._http.post(
+                f"/collections/knowledge_base/search",
+                json={"query": "bibliotecas para análise de dados", "limit": 2}
+            ),
+            # Usando endpoint de query com filtro
+            client._http.post(
+                f"/collections/knowledge_base/query",
+                json={"filters": {"title": {"$like": "%Ciência%"}}, "limit": 10}
+            ),
         )
-        semantic_results = response.get("results", [])
+
+        print("🔍 Busca semântica: 'bibliotecas para análise de dados'")
+        semantic_results = semantic_response.get("results", [])
         print(f"   Resultados por similaridade vetorial: {len(semantic_results)}")
         for result in semantic_results:
             record = result['record']
@@ -195,12 +216,7 @@ async def main():
         print()
         
         print("🔍 Busca por filtro: title contém 'Ciência'")
-        # Usando endpoint de query com filtro  
-        response = await client._http.post(
-            f"/collections/knowledge_base/query",
-            json={"filters": {"title": {"$like": "%Ciência%"}}, "limit": 10}
-        )
-        exact_results = response.get("results", [])
+        exact_results = exact_response.get("results", [])
         print(f"   Resultados por filtro: {len(exact_results)}")
         for result in exact_results:
             print(f"   - {result['title']}")
@@ -225,7 +241,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main(main())
     except Exception as e:
         print(f"\n❌ Erro: {e}")
         print("\nNOTA: Este teste requer GEMINI_API_KEY configurada no .env")
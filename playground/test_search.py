@@ -2,15 +2,23 @@
 
 import asyncio
 
-from cortexdb import CortexClient, FieldDefinition, FieldType
+from cortexdb import FieldDefinition, FieldType
 
-from helpers import ensure_gemini_provider
+from helpers import ensure_gemini_provider, run_main, shared_cortex_client
+
+PLAYGROUND_SEARCH_FIELDS = (
+    FieldDefinition(name="title", type=FieldType.STRING),
+    FieldDefinition(
+        name="content", type=FieldType.TEXT, vectorize=True
+    ),  # Vai vetorizar
+    FieldDefinition(name="category", type=FieldType.STRING),
+)
 
 
 async def main():
     print("=== Teste de Busca Semântica ===\n")
 
-    async with CortexClient("http://localhost:8000") as client:
+    async with shared_cortex_client() as client:
         # 0. Configurar embedding provider
         print("0. Configurando embedding provider...")
         try:
@@ -22,20 +30,9 @@ async def main():
 
         # 1. Criar collection com vectorização
         print("1. Criando collection com vectorização...")
-        try:
-            await client.collections.delete("playground_search")
-        except:
-            pass
-
-        schema = await client.collections.create(
+        schema = await client.collections.create_or_replace(
             name="playground_search",
-            fields=[
-                FieldDefinition(name="title", type=FieldType.STRING),
-                FieldDefinition(
-                    name="content", type=FieldType.TEXT, vectorize=True
-                ),  # Vai vetorizar
-                FieldDefinition(name="category", type=FieldType.STRING),
-            ],
+            fields=list(PLAYGROUND_SEARCH_FIELDS),
             embedding_provider=provider_id,
         )
         print(f"   Collection: {schema.name}\n")
@@ -70,39 +67,38 @@ async def main():
             },
         ]
 
-        record_ids = []
+        await client.records.bulk_create(collection="playground_search", data=docs)
         for doc in docs:
-            record = await client.records.create(collection="playground_search", data=doc)
-            record_ids.append(record.id)
             print(f"   - {doc['title']}")
         print()
 
-        # 3. Busca semântica
+        # 3 e 4 são independentes - disparadas juntas
         print("3. Buscando: 'artificial intelligence and learning'...")
-        results = await client.records.query(
-            collection="playground_search",
-            query="artificial intelligence and learning",
-            limit=3,
+        print("4. Buscando 'programming' apenas em category='programming'...\n")
+        results, filtered = await asyncio.gather(
+            client.records.query(
+                collection="playground_search",
+                query="artificial intelligence and learning",
+                limit=3,
+            ),
+            client.records.query(
+                collection="playground_search",
+                query="programming languages",
+                limit=5,
+                filters={"category": "programming"},
+            ),
         )
 
-        print(f"   Resultados: {len(results)}\n")
+        print(f"3. Resultados: {len(results)}\n")
         for i, result in enumerate(results, 1):
+            data = result.data
             print(f"   {i}. Score: {result.score:.4f}")
-            print(f"      Title: {result.data['title']}")
-            print(f"      Category: {result.data['category']}")
+            print(f"      Title: {data['title']}")
+            print(f"      Category: {data['category']}")
             print()
 
-        # 4. Busca com filtros
-        print("4. Buscando 'programming' apenas em category='programming'...")
-        results = await client.records.query(
-            collection="playground_search",
-            query="programming languages",
-            limit=5,
-            filters={"category": "programming"},
-        )
-
-        print(f"   Resultados: {len(results)}\n")
-        for i, result in enumerate(results, 1):
+        print(f"4. Resultados: {len(filtered)}\n")
+        for i, result in enumerate(filtered, 1):
             print(f"   {i}. {result.data['title']} (score: {result.score:.4f})")
         print()
 
@@ -116,7 +112,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main(main())
     except Exception as e:
         print(f"\n❌ Erro: {e}")
         print("\nNOTA: Busca semântica requer embedding provider configurado!")
@@ -1,14 +1,22 @@
 """Teste com embedding provider configurado."""
 
 import asyncio
+import time
 
-from cortexdb import CortexClient, FieldDefinition, FieldType
+from cortexdb import FieldDefinition, FieldType
 
+from helpers import Pipeline, progress_log, run_in_background, run_main, shared_cortex_client
+
+# Schema fixo, montado uma vez no import; valores constantes dispensam a validação do Pydantic
+PLAYGROUND_VECTORIZED_FIELDS = (
+    FieldDefinition.model_construct(name="title", type=FieldType.STRING),
+    FieldDefinition.model_construct(name="content", type=FieldType.TEXT, vectorize=True),
+)
 
-async def main():
-    print("=== Teste com Embedding Provider ===\n")
 
-    async with CortexClient("http://localhost:8000") as client:
+async def main():
+    async with shared_cortex_client() as client, progress_log() as log:
+        log("=== Teste com Embedding Provider ===\n")
         # Este teste requer que você tenha configurado um embedding provider
         # no gateway (via /settings/embeddings)
         
@@ -17,89 +25,146 @@ async def main():
         # 2. Use o ID do provider abaixo
         PROVIDER_ID = "seu-provider-id-aqui"  # Substitua pelo ID real
         
-        print("⚠️  ATENÇÃO: Este teste requer provider configurado!")
-        print(f"   Configure um provider e atualize PROVIDER_ID no código")
-        print()
+        log("⚠️  ATENÇÃO: Este teste requer provider configurado!")
+        log(f"   Configure um provider e atualize PROVIDER_ID no código")
+        log()
 
         # 1. Criar collection com vectorização
-        print("1. Criando collection com vectorização...")
-        try:
-            # Tenta deletar collection anterior
-            await client.collections.delete("playground_vectorized")
-        except:
-            pass
+        log("1. Criando collection com vectorização...")
+        # Remove collection anterior (sem 404 quando não existe)
+        await client.collections.delete("playground_vectorized", ignore_missing=True)
 
         try:
             schema = await client.collections.create(
                 name="playground_vectorized",
-                fields=[
-                    FieldDefinition(name="title", type=FieldType.STRING),
-                    FieldDefinition(
-                        name="content", type=FieldType.TEXT, vectorize=True
-                    ),
-                ],
+                fields=list(PLAYGROUND_VECTORIZED_FIELDS),
                 embedding_provider=PROVIDER_ID,
             )
-            print(f"   ✅ Collection criada: {schema.name}\n")
-
-            # 2. Criar record com conteúdo que será vetorizado
-            print("2. Criando record com conteúdo vetorizável...")
-            record = await client.records.create(
-                collection="playground_vectorized",
-                data={
+            log(f"   ✅ Collection criada: {schema.name}\n")
+
+            # 2. Criar records com conteúdo que será vetorizado (um único request)
+            log("2. Criando records com conteúdo vetorizável...")
+            # Paráfrases da mesma pergunta, buscadas no passo 3
+            queries = ["programming language", "coding languages", "languages for software"]
+            docs = [
+                {
                     "title": "Introdução ao Python",
                     "content": "Python é uma linguagem de programação versátil e poderosa.",
                 },
+                {
+                    "title": "Introdução ao Rust",
+                    "content": "Rust é uma linguagem de sistemas focada em segurança de memória.",
+                },
+                {
+                    "title": "Receita de pão",
+                    "content": "Misture farinha, água, sal e fermento e deixe a massa descansar.",
+                },
+            ]
+            insert_task = asyncio.create_task(
+                client.records.create_many(
+                    collection="playground_vectorized",
+                    data=docs,
+                    batch_size=64,
+                )
             )
-            print(f"   ✅ Record ID: {record.id}\n")
-
-            # 3. Fazer busca semântica
-            print("3. Fazendo busca semântica...")
-            try:
-                results = await client.search.semantic_search(
+            # Pré-busca em paralelo com o insert: a collection ainda está vazia, mas
+            # os embeddings das consultas ficam em cache no gateway para o passo 3
+            prefetch_task = asyncio.create_task(
+                client.search.semantic_search_batch(
                     collection="playground_vectorized",
-                    query="programming language",
+                    queries=queries,
                     limit=5,
                 )
-                print(f"   ✅ Encontrados {len(results)} resultados")
-                if results:
-                    print(f"   Primeiro resultado: {results[0].data.get('title')}")
-            except Exception as e:
-                print(f"   ⚠️  Busca falhou: {e}")
+            )
+            record_ids, _ = await asyncio.gather(
+                insert_task, asyncio.gather(prefetch_task, return_exceptions=True)
+            )
+            record_id = record_ids[0]
+            log(f"   ✅ {len(record_ids)} records criados (primeiro ID: {record_id})\n")
+
+            # 3 e 4 só dependem do record existir - disparados juntos no pipeline
+            # (TaskGroup no Python 3.11+; cada passo reporta a própria falha)
+            pipeline = Pipeline(max_concurrent=4)
+            # Paráfrases da mesma pergunta: um único request, embeddings já em cache
+            pipeline.add(
+                client.search.semantic_search_batch(
+                    collection="playground_vectorized",
+                    queries=queries,
+                    limit=5,
+                )
+            )
+            pipeline.add(
+                client.records.get_vectors_batch("playground_vectorized", record_ids)
+            )
+            batches, vectors_by_id = await pipeline.results(return_exceptions=True)
 
-            print()
+            # 3. Fazer busca semântica
+            log("3. Fazendo busca semântica...")
+            if isinstance(batches, Exception):
+                log(f"   ⚠️  Busca falhou: {batches}")
+            else:
+                for query, results in zip(queries, batches):
+                    log(f"   ✅ '{query}': {len(results)} resultados")
+                    if results:
+                        log(f"      Primeiro resultado: {results[0].data.get('title')}")
+
+            log()
+
+            # 3b. Busca ANN ajustada (ef_search menor + int8 com rescore) vs padrão
+            log("3b. Comparando busca ANN ajustada com a padrão...")
+            for label, params in (
+                ("ajustada", {"ef_search": 32, "quantization": "int8", "rescore": True}),
+                ("padrão", {}),
+            ):
+                started = time.perf_counter()
+                try:
+                    results = await client.search.semantic_search(
+                        collection="playground_vectorized",
+                        query="programming language",
+                        limit=5,
+                        **params,
+                    )
+                except Exception as e:
+                    log(f"   ⚠️  Busca {label} falhou: {e}")
+                    continue
+                took_ms = (time.perf_counter() - started) * 1000
+                top = results[0].data.get("title") if results else "-"
+                log(f"   ✅ {label}: {len(results)} resultados em {took_ms:.1f}ms (topo: {top})")
+
+            log()
 
             # 4. Verificar vectors
-            print("4. Verificando vectors...")
-            try:
-                vectors = await client.records.get_vectors("playground_vectorized", record.id)
-                print(f"   ✅ Total de chunks: {len(vectors)}")
+            log("4. Verificando vectors...")
+            if isinstance(vectors_by_id, Exception):
+                log(f"   ⚠️  Falha ao obter vectors: {vectors_by_id}")
+            else:
+                vectors = vectors_by_id.get(record_id, [])
+                total = sum(len(chunks) for chunks in vectors_by_id.values())
+                log(f"   ✅ Total de chunks: {total} em {len(vectors_by_id)} records")
                 if vectors:
-                    print(f"   Primeiro chunk: {vectors[0].text[:100]}...")
-            except Exception as e:
-                print(f"   ⚠️  Falha ao obter vectors: {e}")
+                    log(f"   Primeiro chunk: {vectors[0].text[:100]}...")
 
-            print()
+            log()
 
-            # 5. Cleanup
-            print("5. Limpando...")
-            await client.collections.delete("playground_vectorized")
-            print("   ✅ Limpo!\n")
+            # 5. Cleanup em segundo plano (aguardado ao sair do client)
+            log("5. Limpando...")
+            run_in_background(client.collections.delete("playground_vectorized"))
+            log("   ✅ Limpeza agendada!\n")
 
-            print("✅ Teste com provider concluído!")
+            log("✅ Teste com provider concluído!")
 
         except ValueError as e:
             if "embedding_provider" in str(e):
-                print(f"   ❌ Erro: {e}")
-                print()
-                print("💡 SOLUÇÃO:")
-                print("   1. Configure um embedding provider no gateway")
-                print("   2. Use curl para configurar ou acesse /settings/embeddings")
-                print("   3. Atualize PROVIDER_ID com o ID real do provider")
+                log(f"   ❌ Erro: {e}")
+                log()
+                log("💡 SOLUÇÃO:")
+                log("   1. Configure um embedding provider no gateway")
+                log("   2. Use curl para configurar ou acesse /settings/embeddings")
+                log("   3. Atualize PROVIDER_ID com o ID real do provider")
             else:
                 raise
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main(main())
 